@@ -1,3 +1,3 @@
-from .config import get_settings, validate_settings, Settings
+from .config import get_settings, validate_settings, load_environment, Settings
 
-__all__ = ["get_settings", "validate_settings", "Settings"]
+__all__ = ["get_settings", "validate_settings", "load_environment", "Settings"]
@@ -1,72 +1,190 @@
 import os
-from pydantic import BaseSettings, Field, ValidationError as PydanticValidationError
-from typing import Optional, List
-from functools import lru_cache
+import json
+from dataclasses import dataclass, fields
+from typing import Optional, List, Tuple, Callable, Dict, Any, Mapping
+from functools import lru_cache, cached_property
 from dotenv import load_dotenv, find_dotenv
 import logging
 from src.utils.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Marker set in os.environ once the .env file has been loaded for this process
+DOTENV_LOADED_FLAG = "_DOTENV_LOADED"
+
+
+def load_environment() -> None:
+    """
+    Load environment variables from the .env file, at most once per process.
+    
+    The marker in os.environ is inherited by child processes, so reloader
+    workers and scripts that import this module don't re-parse the file.
+    """
+    if os.environ.get(DOTENV_LOADED_FLAG):
+        return
+    
+    try:
+        env_file = find_dotenv()
+        load_dotenv(env_file, override=True)
+        if env_file:
+            logger.info(f"Loaded environment from {env_file}")
+        else:
+            logger.warning("No .env file found, using environment variables")
+    except Exception as e:
+        logger.warning(f"Error loading .env file: {str(e)}")
+    
+    os.environ[DOTENV_LOADED_FLAG] = "1"
+
+
 # Load environment variables from .env file
-try:
-    env_file = find_dotenv()
-    load_dotenv(env_file, override=True)
-    if env_file:
-        logger.info(f"Loaded environment from {env_file}")
-    else:
-        logger.warning("No .env file found, using environment variables")
-except Exception as e:
-    logger.warning(f"Error loading .env file: {str(e)}")
-
-class Settings(BaseSettings):
+load_environment()
+
+
+class SettingsValidationError(ValueError):
+    """Raised when environment values cannot be parsed into Settings."""
+    
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self._errors = errors
+        super().__init__(f"{len(errors)} invalid setting(s): {errors}")
+    
+    def errors(self) -> List[Dict[str, Any]]:
+        """Return the per-field error list (mirrors pydantic's ValidationError.errors())."""
+        return self._errors
+
+
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value (same spellings pydantic accepts)."""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"value could not be parsed to a boolean: {value!r}")
+
+
+def _parse_str_tuple(value: str) -> Tuple[str, ...]:
+    """
+    Parse a list environment value given as a JSON array or comma-separated string.
+    
+    Returned as a tuple so Settings stays hashable.
+    """
+    value = value.strip()
+    if value.startswith("["):
+        parsed = json.loads(value)
+        if not isinstance(parsed, list):
+            raise ValueError(f"value is not a valid list: {value!r}")
+        return tuple(str(item) for item in parsed)
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+# Parsers for each field type used by Settings
+_FIELD_PARSERS: Dict[Any, Callable[[str], Any]] = {
+    str: str,
+    Optional[str]: str,
+    int: int,
+    bool: _parse_bool,
+    Tuple[str, ...]: _parse_str_tuple,
+}
+
+
+@dataclass(frozen=True)
+class Settings:
     """Application settings loaded from environment variables."""
     
     # App settings
-    APP_NAME: str = Field(default="Voice-TimeLogger-Agent")
-    APP_VERSION: str = Field(default="1.0.0")
-    DEBUG: bool = Field(default=False)
+    APP_NAME: str = "Voice-TimeLogger-Agent"
+    APP_VERSION: str = "1.0.0"
+    DEBUG: bool = False
     
     # API settings
-    API_HOST: str = Field(default="0.0.0.0")
-    API_PORT: int = Field(default=8000)
-    CORS_ORIGINS: List[str] = Field(default=["*"])
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+    CORS_ORIGINS: Tuple[str, ...] = ("*",)
     
     # Temp directory
-    TEMP_DIR: str = Field(default="./tmp/meeting_recordings")
+    TEMP_DIR: str = "./tmp/meeting_recordings"
     
     # OpenAI API settings
     OPENAI_API_KEY: Optional[str] = None
-    DEFAULT_LLM_MODEL: str = Field(default="gpt-4o-mini")
+    DEFAULT_LLM_MODEL: str = "gpt-4o-mini"
+    # Models to fall back to, in order, when the default one is rate limited
+    LLM_FALLBACK_MODELS: Tuple[str, ...] = ()
+    # OpenAI quota to stay within for extraction calls (0 means no limit)
+    LLM_REQUESTS_PER_MINUTE: int = 0
+    LLM_TOKENS_PER_MINUTE: int = 0
+    # Number of extraction results kept for exact repeat requests (0 disables)
+    LLM_CACHE_SIZE: int = 1000
     
     # Google Sheets settings
     GOOGLE_CREDENTIALS_FILE: Optional[str] = None
     GOOGLE_SPREADSHEET_ID: Optional[str] = None
     
     # Notification settings
-    ENABLE_EMAIL_NOTIFICATIONS: bool = Field(default=False)
-    ENABLE_SLACK_NOTIFICATIONS: bool = Field(default=False)
-    NOTIFICATIONS_DEFAULT: bool = Field(default=False)
+    ENABLE_EMAIL_NOTIFICATIONS: bool = False
+    ENABLE_SLACK_NOTIFICATIONS: bool = False
+    NOTIFICATIONS_DEFAULT: bool = False
+    # Send notifications alongside the storage write instead of after it
+    # (notifications then go out even if storage fails)
+    PARALLEL_STORAGE_AND_NOTIFICATIONS: bool = False
     
     # Slack notification settings
     SLACK_WEBHOOK_URL: Optional[str] = None
     
     # Email notification settings
     SMTP_SERVER: Optional[str] = None
-    SMTP_PORT: int = Field(default=587)
+    SMTP_PORT: int = 587
     SENDER_EMAIL: Optional[str] = None
     SENDER_PASSWORD: Optional[str] = None
-    RECIPIENT_EMAILS: str = Field(default="")
+    RECIPIENT_EMAILS: str = ""
     
     # Logging settings
-    LOG_LEVEL: str = Field(default="INFO")
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: Optional[str] = None
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """
+        Build settings from environment variables (case-sensitive names).
+        
+        Args:
+            environ: Mapping to read from (defaults to os.environ)
+            
+        Returns:
+            Settings instance
+            
+        Raises:
+            ValueError: If one or more values cannot be parsed
+        """
+        environ = os.environ if environ is None else environ
+        values = {}
+        errors = []
+        
+        for settings_field in fields(cls):
+            raw_value = environ.get(settings_field.name)
+            if raw_value is None:
+                continue
+            
+            try:
+                values[settings_field.name] = _FIELD_PARSERS[settings_field.type](raw_value)
+            except ValueError as e:
+                errors.append({"loc": (settings_field.name,), "msg": str(e)})
+        
+        if errors:
+            raise SettingsValidationError(errors)
+        
+        return cls(**values)
+    
+    @cached_property
+    def recipient_emails_list(self) -> List[str]:
+        """Parsed RECIPIENT_EMAILS, computed once per settings instance."""
+        return [e.strip() for e in self.RECIPIENT_EMAILS.split(",") if e.strip()]
 
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """
     Create a cached instance of the settings.
@@ -78,10 +196,10 @@ def get_settings() -> Settings:
         ConfigurationError: If settings cannot be loaded
     """
     try:
-        settings = Settings()
+        settings = Settings.from_env()
         logger.debug("Settings loaded successfully")
         return settings
-    except PydanticValidationError as e:
+    except SettingsValidationError as e:
         error_details = {"validation_errors": e.errors()}
         logger.error(f"Settings validation error: {error_details}")
         raise ConfigurationError(
@@ -97,49 +215,59 @@ def get_settings() -> Settings:
         )
 
 
+@lru_cache(maxsize=None)
+def _credentials_file_exists(path: Optional[str]) -> bool:
+    """
+    Check whether a credentials file exists, memoized per path.
+    
+    Args:
+        path: Path to the credentials file
+        
+    Returns:
+        True if a path is set and the file exists, False otherwise
+    """
+    return bool(path) and os.path.exists(path)
+
+
+# Validation rules as (predicate returning True when missing, setting name)
+_SETTING_RULES: Tuple[Tuple[Callable[[Settings], bool], str], ...] = (
+    (lambda s: not s.OPENAI_API_KEY, "OPENAI_API_KEY"),
+    (lambda s: not _credentials_file_exists(s.GOOGLE_CREDENTIALS_FILE), "GOOGLE_CREDENTIALS_FILE"),
+    (lambda s: not s.GOOGLE_SPREADSHEET_ID, "GOOGLE_SPREADSHEET_ID"),
+    
+    # Email notification settings
+    (lambda s: s.ENABLE_EMAIL_NOTIFICATIONS and not s.SMTP_SERVER, "SMTP_SERVER"),
+    (lambda s: s.ENABLE_EMAIL_NOTIFICATIONS and not s.SENDER_EMAIL, "SENDER_EMAIL"),
+    (lambda s: s.ENABLE_EMAIL_NOTIFICATIONS and not s.SENDER_PASSWORD, "SENDER_PASSWORD"),
+    (lambda s: s.ENABLE_EMAIL_NOTIFICATIONS and not s.RECIPIENT_EMAILS, "RECIPIENT_EMAILS"),
+    
+    # Slack notification settings
+    (lambda s: s.ENABLE_SLACK_NOTIFICATIONS and not s.SLACK_WEBHOOK_URL, "SLACK_WEBHOOK_URL"),
+)
+
+
 def validate_settings() -> List[str]:
     """
     Validate that all required settings are present.
     
     Returns:
-        List of missing required settings
+        Sorted list of missing required settings (without duplicates)
     
     Raises:
         ConfigurationError: If the settings cannot be accessed
     """
     try:
         settings = get_settings()
-        missing = []
-        
-        # Check for required settings
-        if not settings.OPENAI_API_KEY:
-            missing.append("OPENAI_API_KEY")
-        
-        if not settings.GOOGLE_CREDENTIALS_FILE or not os.path.exists(settings.GOOGLE_CREDENTIALS_FILE):
-            missing.append("GOOGLE_CREDENTIALS_FILE")
-        
-        if not settings.GOOGLE_SPREADSHEET_ID:
-            missing.append("GOOGLE_SPREADSHEET_ID")
         
-        # Check email notification settings
+        # Check notification defaults
         if settings.NOTIFICATIONS_DEFAULT:
             if not settings.ENABLE_EMAIL_NOTIFICATIONS and not settings.ENABLE_SLACK_NOTIFICATIONS:
                 logger.warning("NOTIFICATIONS_DEFAULT is True but no notification channels are enabled")
-                
-        if settings.ENABLE_EMAIL_NOTIFICATIONS:
-            if not settings.SMTP_SERVER:
-                missing.append("SMTP_SERVER")
-            if not settings.SENDER_EMAIL:
-                missing.append("SENDER_EMAIL")
-            if not settings.SENDER_PASSWORD:
-                missing.append("SENDER_PASSWORD")
-            if not settings.RECIPIENT_EMAILS:
-                missing.append("RECIPIENT_EMAILS")
         
-        # Check Slack notification settings
-        if settings.ENABLE_SLACK_NOTIFICATIONS:
-            if not settings.SLACK_WEBHOOK_URL:
-                missing.append("SLACK_WEBHOOK_URL")
+        # Single pass over the rule table; the set dedupes, sorting keeps order stable
+        missing = sorted({
+            name for is_missing, name in _SETTING_RULES if is_missing(settings)
+        })
         
         # Log the results
         if missing:
@@ -6,7 +6,7 @@ Uses OpenAI's text-to-speech API to create sample audio files.
 import os
 import sys
 import argparse
-import time
+import asyncio
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
@@ -17,15 +17,17 @@ import logging
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.utils import configure_logging, get_logger
-from openai import OpenAI
-from dotenv import load_dotenv
+from config.config import load_environment
 
 
-load_dotenv()
+load_environment()
 
 configure_logging(level="INFO")
 logger = get_logger(__name__)
 
+# Maximum number of concurrent TTS requests
+MAX_CONCURRENT_REQUESTS = 3
+
 # Sample meeting descriptions for testing
 SAMPLE_MEETING_TEXTS = [
     "I had a meeting with Acme Corporation on March 15th from 10:00 AM to 11:30 AM. We discussed their new product line and marketing strategy for Q2.",
@@ -44,12 +46,32 @@ def create_directory(path: str) -> None:
     os.makedirs(path, exist_ok=True)
     logger.info(f"Ensured directory exists: {path}")
 
-def generate_audio_with_openai(
+def create_openai_client(api_key: Optional[str] = None):
+    """
+    Create an async OpenAI client for text-to-speech requests.
+    
+    Args:
+        api_key: OpenAI API key (if None, uses environment variable)
+        
+    Returns:
+        AsyncOpenAI client instance
+    """
+    api_key = api_key or os.environ.get("OPENAI_API_KEY")
+    
+    if not api_key:
+        raise ValueError("OpenAI API key not provided or found in environment")
+    
+    # Imported here so argparse --help/errors don't pay for the openai import
+    from openai import AsyncOpenAI
+    
+    return AsyncOpenAI(api_key=api_key)
+
+async def generate_audio_with_openai(
     text: str, 
     output_file: str,
+    client,
     voice: str = "alloy",
-    model: str = "tts-1",
-    api_key: Optional[str] = None
+    model: str = "tts-1"
 ) -> str:
     """
     Generate audio file using OpenAI's text-to-speech API.
@@ -57,33 +79,25 @@ def generate_audio_with_openai(
     Args:
         text: Text to convert to speech
         output_file: Path to save the audio file
+        client: AsyncOpenAI client (see create_openai_client)
         voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
         model: TTS model to use
-        api_key: OpenAI API key (if None, uses environment variable)
         
     Returns:
         Path to the generated audio file
     """
-    api_key = api_key or os.environ.get("OPENAI_API_KEY")
-    
-    if not api_key:
-        raise ValueError("OpenAI API key not provided or found in environment")
-    
-    # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
-    
     logger.info(f"Generating audio with OpenAI TTS API: model={model}, voice={voice}")
     
     try:
         # Create the audio file
-        response = client.audio.speech.create(
+        response = await client.audio.speech.create(
             model=model,
             voice=voice,
             input=text
         )
         
         # Save the audio file
-        response.stream_to_file(output_file)
+        await response.astream_to_file(output_file)
         
         logger.info(f"Audio file generated successfully: {output_file}")
         return output_file
@@ -92,6 +106,63 @@ def generate_audio_with_openai(
         logger.error(f"Error generating audio: {str(e)}", exc_info=True)
         raise
 
+async def _generate_sample(
+    client,
+    semaphore: asyncio.Semaphore,
+    index: int,
+    text: str,
+    output_file: str,
+    voice: str
+) -> Optional[str]:
+    """
+    Generate a single sample, bounded by the shared semaphore.
+    
+    Returns:
+        Path to the generated audio file, or None if generation failed
+    """
+    async with semaphore:
+        try:
+            return await generate_audio_with_openai(
+                text=text,
+                output_file=output_file,
+                client=client,
+                voice=voice
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate audio for sample {index+1}: {str(e)}")
+            return None
+
+async def _generate_all(
+    output_dir: str,
+    num_samples: int,
+    api_key: Optional[str],
+    voice: str
+) -> List[str]:
+    """Generate all samples concurrently and return the successful paths."""
+    # One client for the whole batch so its connection pool is reused
+    client = create_openai_client(api_key)
+    
+    # The semaphore keeps us under the API rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    # One timestamp per batch; the index suffix keeps filenames unique
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    
+    tasks = []
+    for i in range(min(num_samples, len(SAMPLE_MEETING_TEXTS))):
+        text = SAMPLE_MEETING_TEXTS[i]
+        filename = f"test_meeting_{timestamp}_{i+1}.mp3"
+        output_file = os.path.join(output_dir, filename)
+        
+        tasks.append(_generate_sample(client, semaphore, i, text, output_file, voice))
+    
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        await client.close()
+    
+    return [path for path in results if path]
+
 def generate_test_files(
     output_dir: str, 
     num_samples: int = 5,
@@ -100,6 +171,7 @@ def generate_test_files(
 ) -> List[str]:
     """
     Generate test audio files with meeting descriptions.
+    Samples are generated concurrently (up to MAX_CONCURRENT_REQUESTS at a time).
     
     Args:
         output_dir: Directory to save the audio files
@@ -112,30 +184,7 @@ def generate_test_files(
     """
     create_directory(output_dir)
     
-    generated_files = []
-    
-    for i in range(min(num_samples, len(SAMPLE_MEETING_TEXTS))):
-        text = SAMPLE_MEETING_TEXTS[i]
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        filename = f"test_meeting_{timestamp}_{i+1}.mp3"
-        output_file = os.path.join(output_dir, filename)
-        
-        try:
-            generate_audio_with_openai(
-                text=text,
-                output_file=output_file,
-                voice=voice,
-                api_key=api_key
-            )
-            generated_files.append(output_file)
-            
-            # Slight delay to avoid hitting rate limits
-            time.sleep(1)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate audio for sample {i+1}: {str(e)}")
-    
-    return generated_files
+    return asyncio.run(_generate_all(output_dir, num_samples, api_key, voice))
 
 def main():
     """Main function to parse arguments and generate test audio files."""
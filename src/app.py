@@ -11,8 +11,9 @@ from config.config import get_settings, validate_settings
 from src.utils import configure_logging, get_logger
 from src.utils.exceptions import ConfigurationError
 
-# First configure basic logging before we do anything else
-configure_logging()
+# Minimal logging until init_app() applies the configured level and handlers.
+# basicConfig is a no-op if logging is already configured.
+logging.basicConfig(level=logging.INFO)
 logger = get_logger(__name__)
 
 def init_app():
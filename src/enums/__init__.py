@@ -7,7 +7,7 @@ from src.enums.log_levels import LogLevel
 from src.enums.notification import NotificationStatus, NotificationChannel
 from src.enums.status_codes import ProcessingStatus, ExtractionStatus, StorageStatus
 
-__all__ = [
+__all__ = (
     # Error codes
     "ErrorCode",
     
@@ -22,4 +22,4 @@ __all__ = [
     # notification enums
     "NotificationStatus",
     "NotificationChannel",
-]
\ No newline at end of file
+)
\ No newline at end of file
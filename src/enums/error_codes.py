@@ -2,10 +2,10 @@
 Error code enums for the Voice-TimeLogger-Agent.
 """
 
-from enum import Enum, auto
+from enum import IntEnum
 
 
-class ErrorCode(Enum):
+class ErrorCode(IntEnum):
     """Enum of error codes for categorizing exceptions."""
     
     # General errors (1000-1999)
@@ -29,7 +29,11 @@ class LogLevel(Enum):
         Raises:
             ValueError: If the level name is not valid
         """
-        try:
-            return cls[level_name.upper()].value
-        except KeyError:
-            raise ValueError(f"Invalid log level: {level_name}")
\ No newline at end of file
+        value = _NAME_TO_VALUE.get(level_name.upper())
+        if value is None:
+            raise ValueError(f"Invalid log level: {level_name}")
+        return value
+
+
+# Flat name -> numeric level lookup, built once at import
+_NAME_TO_VALUE = {member.name: member.value for member in LogLevel}
\ No newline at end of file
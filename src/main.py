@@ -2,9 +2,9 @@
 Main application entry point for Voice-TimeLogger-Agent API.
 """
 
-import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 import logging
 from typing import Dict, Any, Optional
@@ -12,14 +12,54 @@ import os
 
 from config.config import get_settings
 from src.app import init_app
-from src.routes import api_router
-from src.routes.base import setup_middleware
+from src.middleware import setup_middleware
 from src.utils import get_logger, BaseAppException, ErrorCode
 from src.utils.exceptions import ConfigurationError
 
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize the application on startup and clean up on shutdown.
+
+    Required settings are validated before the route modules (and the
+    services they pull in) are imported, so a misconfigured deployment
+    fails fast.
+    """
+    logger.info("Starting Voice-TimeLogger-Agent API")
+    try:
+        init_app()  # calls existing app.py initialization
+        
+        # Include API routes (once, even if the lifespan runs again)
+        if not app.state.routes_included:
+            from src.routes import routers
+            for router in routers:
+                app.include_router(router)
+            app.state.routes_included = True
+        
+        logger.info("Application initialized successfully")
+    except ConfigurationError as e:
+        logger.error(f"Configuration error: {str(e)}", exc_info=True)
+        # Exit the application if critical configuration is missing
+        os._exit(1)
+    except Exception as e:
+        logger.error(f"Failed to initialize application: {str(e)}", exc_info=True)
+        # Exit the application if initialization fails
+        os._exit(1)
+    
+    yield
+    
+    logger.info("Shutting down Voice-TimeLogger-Agent API")
+    if app.state.routes_included:
+        from src.routes.dependencies import close_shared_managers
+        await close_shared_managers()
+
+
+# Settings are resolved once here; get_settings() caches them, so init_app()
+# and the services reuse this instance
 settings = get_settings()
 
 # Create FastAPI app
@@ -27,37 +67,52 @@ app = FastAPI(
     title="Voice-TimeLogger-Agent API",
     description="API for automating consultant work hours using voice messages",
     version=settings.APP_VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
+app.state.settings = settings
+app.state.routes_included = False
 
 # Initialize the app with middleware
 setup_middleware(app)
 
-# Include API routes
-app.include_router(api_router)
+
+def _request_id(request: Request) -> Optional[str]:
+    """
+    Get the request ID set by RequestIDMiddleware, if any.
+
+    Reads the raw state dict from the ASGI scope rather than going through
+    getattr() on request.state, which raises and swallows an AttributeError
+    when the ID was never set.
+    """
+    state = request.scope.get("state")
+    return state.get("request_id") if state else None
+
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
-    error_details = []
-    for error in exc.errors():
-        error_details.append({
+    error_details = [
+        {
             "loc": error.get("loc", []),
             "msg": error.get("msg", ""),
             "type": error.get("type", "")
-        })
+        }
+        for error in exc.errors()
+    ]
     
     logger.warning(f"Validation error: {error_details}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "success": False,
             "error": "Validation error",
-            "error_code": ErrorCode.VALIDATION_ERROR.value,
+            "error_code": ErrorCode.VALIDATION_ERROR,
             "error_details": error_details,
-            "request_id": getattr(request.state, "request_id", None)
+            "request_id": _request_id(request)
         }
     )
 
@@ -66,14 +121,14 @@ async def app_exception_handler(request: Request, exc: BaseAppException):
     """Handle application exceptions."""
     logger.error(f"Application error: {str(exc)}", exc_info=True)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
             "error": exc.message,
             "error_code": exc.code_value,
             "error_details": exc.details,
-            "request_id": getattr(request.state, "request_id", None)
+            "request_id": _request_id(request)
         }
     )
 
@@ -82,38 +137,19 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
             "error": f"Unexpected error: {str(exc)}",
-            "error_code": ErrorCode.UNKNOWN_ERROR.value,
-            "request_id": getattr(request.state, "request_id", None)
+            "error_code": ErrorCode.UNKNOWN_ERROR,
+            "request_id": _request_id(request)
         }
     )
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    logger.info("Starting Voice-TimeLogger-Agent API")
-    try:
-        init_app()  # calls existing app.py initialization
-        logger.info("Application initialized successfully")
-    except ConfigurationError as e:
-        logger.error(f"Configuration error: {str(e)}", exc_info=True)
-        # Exit the application if critical configuration is missing
-        os._exit(1)
-    except Exception as e:
-        logger.error(f"Failed to initialize application: {str(e)}", exc_info=True)
-        # Exit the application if initialization fails
-        os._exit(1)
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on application shutdown."""
-    logger.info("Shutting down Voice-TimeLogger-Agent API")
-
 if __name__ == "__main__":
+    import uvicorn
+    
     try:
         host = settings.API_HOST
         port = settings.API_PORT
@@ -0,0 +1,109 @@
+"""
+Common middleware setup for the Voice-TimeLogger-Agent API.
+
+Kept outside src.routes so the app can install middleware at import time
+without pulling in the route modules and the services behind them.
+"""
+
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import time
+from config.config import get_settings
+from src.utils import get_logger, generate_request_id
+
+
+logger = get_logger(__name__)
+
+# Add CORS middleware setup
+def setup_cors(app):
+    """
+    Setup CORS middleware for the application.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    settings = get_settings()
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    logger.info(f"CORS middleware configured with origins: {settings.CORS_ORIGINS}")
+
+
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware that adds a request ID to each request.
+    
+    The ID is stored in the scope state (visible as request.state.request_id)
+    and returned in the X-Request-ID response header. Unlike an
+    @app.middleware("http") function, this doesn't wrap every request in
+    Starlette's BaseHTTPMiddleware machinery.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = generate_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+        
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+        
+        # Log through the module logger with lazy %-formatting rather than
+        # building a ContextAdapter per request; the "[request_id]" prefix
+        # matches what the adapter would produce
+        log_extra = {"request_id": request_id}
+        
+        # Log the request
+        start_time = time.time()
+        logger.info(
+            "[%s] Request started: %s %s", request_id, method, path,
+            extra=log_extra
+        )
+        
+        try:
+            # Process the request
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            # Log the response
+            process_time = time.time() - start_time
+            logger.info(
+                "[%s] Request completed: %s %s [%d] in %.3fs",
+                request_id, method, path, status_code, process_time,
+                extra=log_extra
+            )
+
+
+# Setup middleware for FastAPI app
+def setup_middleware(app):
+    """
+    Setup all middleware for the application.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    # Add the request ID middleware
+    app.add_middleware(RequestIDMiddleware)
+    
+    # Add CORS middleware
+    setup_cors(app)
+    
+    logger.info("Application middleware configured")
\ No newline at end of file
@@ -7,28 +7,25 @@ from pydantic import BaseModel, Field
 from src.enums import ProcessingStatus, ExtractionStatus, ErrorCode
 
 
-class VoiceUploadRequest(BaseModel):
-    """Request model for voice upload endpoints"""
+class ExtractRequest(BaseModel):
+    """Request model for the meeting data extraction endpoint"""
     
+    text: str = Field(..., description="Text to extract meeting data from")
     customer_hint: Optional[str] = Field(
-        None, 
+        None,
         description="Optional hint about the customer name to improve extraction"
     )
     meeting_date_hint: Optional[str] = Field(
-        None, 
+        None,
         description="Optional hint about the meeting date to improve extraction"
     )
-    notify: bool = Field(
-        False, 
-        description="Whether to send notification after processing"
-    )
     
     class Config:
         schema_extra = {
             "example": {
+                "text": "I had a meeting with Acme Corp yesterday from 2 PM to 3:30 PM.",
                 "customer_hint": "Acme Corp",
-                "meeting_date_hint": "2025-03-31",
-                "notify": True
+                "meeting_date_hint": "2025-03-31"
             }
         }
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict, Any
 from datetime import datetime
 
 class MeetingData(BaseModel):
@@ -32,4 +32,22 @@ class ProcessingResponse(BaseModel):
     
     success: bool = Field(..., description="Whether the processing was successful")
     message: str = Field(..., description="Description of the result")
-    data: Optional[MeetingData] = Field(None, description="Extracted meeting data")
\ No newline at end of file
+    # Plain dict: the meeting data comes from our own extraction pipeline, so
+    # it's passed through as-is (with its status fields) instead of being
+    # validated again field by field through MeetingData
+    data: Optional[Dict[str, Any]] = Field(None, description="Extracted meeting data")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "success": True,
+                "message": "Audio processed and data stored successfully",
+                "data": {
+                    **MeetingData.Config.schema_extra["example"],
+                    "extraction_status": "complete",
+                    "storage_status": "stored",
+                    "notification_status": "skipped",
+                    "notification_message": "Notifications not requested"
+                }
+            }
+        }
@@ -2,8 +2,7 @@
 Routes package for the Voice-TimeLogger-Agent API.
 """
 
-from fastapi import APIRouter
-from src.routes.base import api_router, v1_router
+from src.routes.base import api_router
 from src.routes.speech import router as speech_router
 from src.routes.extraction import router as extraction_router
 from src.utils import get_logger
@@ -11,12 +10,10 @@ from src.utils import get_logger
 
 logger = get_logger(__name__)
 
-# Include all routers
-v1_router.include_router(speech_router)
-v1_router.include_router(extraction_router)
-
-# Include versioned router in the main API router
-api_router.include_router(v1_router)
+# Routers for the app to include. The v1 routers carry the /api/v1 prefix
+# themselves, so each is included into the app once instead of being
+# copied through an intermediate v1 router and the root router first.
+routers = (api_router, speech_router, extraction_router)
 
 # Root endpoint
 @api_router.get("/", tags=["status"])
@@ -1,95 +1,116 @@
 """
-Base router definition and common middleware setup.
+Base router definitions and shared response helpers.
 """
 
-from fastapi import APIRouter, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
-import time
-import uuid
-from typing import Callable
-from config.config import get_settings
-from src.utils import get_logger
+import logging
+from functools import wraps
+from typing import Optional, Callable
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
-
-logger = get_logger(__name__)
+from src.utils import generate_request_id
+from src.utils.exceptions import BaseAppException
 
 # Create the root API router
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
-# Create the versioned router for v1
-v1_router = APIRouter(prefix="/api/v1")
+# Path prefix for the v1 API. Feature routers carry it in their own prefix
+# so the app can include them directly, without an intermediate v1 router
+# (every include_router call rebuilds all of the included routes)
+API_V1_PREFIX = "/api/v1"
 
-settings = get_settings()
 
-# Add CORS middleware setup
-def setup_cors(app):
+def model_response(model: BaseModel, status_code: int = 200) -> ORJSONResponse:
     """
-    Setup CORS middleware for the application.
+    Serialize a response model straight to an ORJSONResponse.
+    
+    Returning a Response skips FastAPI's response_model handling, which would
+    re-validate the already-built model and walk it with jsonable_encoder.
+    Routes keep declaring response_model for the OpenAPI schema.
     
     Args:
-        app: FastAPI application instance
+        model: Response model instance to return
+        status_code: HTTP status code
+        
+    Returns:
+        JSON response with the model's fields
     """
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    logger.info(f"CORS middleware configured with origins: {settings.CORS_ORIGINS}")
+    return ORJSONResponse(content=model.dict(), status_code=status_code)
 
 
-async def request_id_middleware(request: Request, call_next: Callable) -> Response:
+def add_extraction_hints(
+    text: str,
+    customer_hint: Optional[str] = None,
+    meeting_date_hint: Optional[str] = None
+) -> str:
     """
-    Middleware to add request ID to each request.
+    Append optional customer/date hints to the text sent for extraction.
     
     Args:
-        request: FastAPI request object
-        call_next: Next middleware or endpoint handler
+        text: Text to extract meeting data from
+        customer_hint: Optional hint about the customer name
+        meeting_date_hint: Optional hint about the meeting date
         
     Returns:
-        Response with request ID header
+        The text with an "Additional information" line, or the text
+        unchanged if there are no hints
     """
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    
-    request_logger = get_logger(__name__, {"request_id": request_id})
-    
-    # Log the request
-    start_time = time.time()
-    request_logger.info(
-        f"Request started: {request.method} {request.url.path}"
-    )
-    
-    # Process the request
-    response = await call_next(request)
+    if not (customer_hint or meeting_date_hint):
+        return text
     
-    # Log the response
-    process_time = time.time() - start_time
-    status_code = response.status_code
-    request_logger.info(
-        f"Request completed: {request.method} {request.url.path} "
-        f"[{status_code}] in {process_time:.3f}s"
+    hints = (
+        f"Customer is {customer_hint}." if customer_hint else None,
+        f"Meeting date is {meeting_date_hint}." if meeting_date_hint else None
     )
-    
-    # Add request ID to response headers
-    response.headers["X-Request-ID"] = request_id
-    
-    return response
+    return f"{text}\n\nAdditional information: {' '.join(h for h in hints if h)}"
 
 
-# Setup middleware for FastAPI app
-def setup_middleware(app):
+def handle_route_errors(func: Callable) -> Callable:
     """
-    Setup all middleware for the application.
+    Decorator that turns errors raised by a route into HTTP 500 responses.
+    
+    HTTPExceptions pass through unchanged. BaseAppExceptions become a 500
+    with the error code and details; anything else becomes a generic 500.
+    Errors are logged with the request ID under the route module's logger.
+    The wrapped route must take a `request: Request` parameter.
     
     Args:
-        app: FastAPI application instance
+        func: Async route function to wrap
+        
+    Returns:
+        Wrapped route function (FastAPI still sees the original signature)
     """
-    # Add the request ID middleware
-    app.middleware("http")(request_id_middleware)
+    route_logger = logging.getLogger(func.__module__)
     
-    # Add CORS middleware
-    setup_cors(app)
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        
+        except BaseAppException as e:
+            request_id = getattr(kwargs["request"].state, "request_id", None) or generate_request_id()
+            route_logger.error(f"[{request_id}] Application error: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": str(e),
+                    "error_code": e.code_value,
+                    "error_details": e.details,
+                    "request_id": request_id
+                }
+            )
+        
+        except Exception as e:
+            request_id = getattr(kwargs["request"].state, "request_id", None) or generate_request_id()
+            route_logger.error(f"[{request_id}] Unexpected error: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unexpected error: {str(e)}"
+            )
     
-    logger.info("Application middleware configured")
\ No newline at end of file
+    return wrapper
\ No newline at end of file
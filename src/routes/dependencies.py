@@ -0,0 +1,102 @@
+"""
+Shared dependencies for the API routes.
+
+The service managers hold no per-request state, so each one is built once
+and reused across requests along with its OpenAI and Google API clients.
+"""
+
+from functools import lru_cache
+from fastapi import HTTPException
+
+from config.config import get_settings
+from src.services.speech import SpeechManager
+from src.services.extraction import ExtractionManager
+from src.services.storage import StorageManager
+from src.services.notification import NotificationManager
+from src.utils import get_logger
+
+
+logger = get_logger(__name__)
+
+@lru_cache(maxsize=1)
+def _build_speech_manager() -> SpeechManager:
+    settings = get_settings()
+    return SpeechManager(
+        openai_api_key=settings.OPENAI_API_KEY,
+        storage_dir=settings.TEMP_DIR
+    )
+
+@lru_cache(maxsize=1)
+def _build_extraction_manager() -> ExtractionManager:
+    settings = get_settings()
+    return ExtractionManager(
+        openai_api_key=settings.OPENAI_API_KEY
+    )
+
+@lru_cache(maxsize=1)
+def _build_storage_manager() -> StorageManager:
+    settings = get_settings()
+    return StorageManager(
+        google_credentials_file=settings.GOOGLE_CREDENTIALS_FILE,
+        google_spreadsheet_id=settings.GOOGLE_SPREADSHEET_ID
+    )
+
+@lru_cache(maxsize=1)
+def _build_notification_manager() -> NotificationManager:
+    return NotificationManager()
+
+
+# The dependencies are async so FastAPI calls them on the event loop instead
+# of dispatching each one to the threadpool. A failed build isn't cached, so
+# the next request tries again.
+
+async def get_speech_manager() -> SpeechManager:
+    """Dependency to get the shared speech manager instance."""
+    try:
+        return _build_speech_manager()
+    except Exception as e:
+        logger.error(f"Error creating SpeechManager: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Could not initialize speech service: {str(e)}"
+        )
+
+async def get_extraction_manager() -> ExtractionManager:
+    """Dependency to get the shared extraction manager instance."""
+    try:
+        return _build_extraction_manager()
+    except Exception as e:
+        logger.error(f"Error creating ExtractionManager: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Could not initialize extraction service: {str(e)}"
+        )
+
+async def get_storage_manager() -> StorageManager:
+    """Dependency to get the shared storage manager instance."""
+    try:
+        return _build_storage_manager()
+    except Exception as e:
+        logger.error(f"Error creating StorageManager: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Could not initialize storage service: {str(e)}"
+        )
+
+async def get_notification_manager() -> NotificationManager:
+    """Dependency to get the shared notification manager instance."""
+    try:
+        return _build_notification_manager()
+    except Exception as e:
+        logger.error(f"Error creating NotificationManager: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Could not initialize notification service: {str(e)}"
+        )
+
+async def close_shared_managers() -> None:
+    """Release connections held open by the shared managers (called on shutdown)."""
+    if _build_extraction_manager.cache_info().currsize:
+        await _build_extraction_manager().close()
+    if _build_notification_manager.cache_info().currsize:
+        await _build_notification_manager().close()
@@ -2,20 +2,21 @@
 Routes for extracting meeting data from text.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Body
-from typing import Dict, Any, Optional
-import uuid
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any
 
-from src.models.api import MeetingDataResponse, ErrorResponse
+from src.models.api import ExtractRequest, MeetingDataResponse, ErrorResponse
 from src.models.meeting import MeetingData, ProcessingResponse
 from src.services.extraction import ExtractionManager
-from src.utils import get_logger
-from src.utils.exceptions import BaseAppException
-from config.config import get_settings
+from src.routes.base import API_V1_PREFIX, model_response, add_extraction_hints, handle_route_errors
+from src.routes.dependencies import get_extraction_manager
+from src.utils import get_logger, generate_request_id
 
 # Setup router
 router = APIRouter(
-    prefix="/meetings",
+    prefix=f"{API_V1_PREFIX}/meetings",
+    default_response_class=ORJSONResponse,
     tags=["meetings"],
     responses={
         400: {"model": ErrorResponse},
@@ -25,21 +26,6 @@ router = APIRouter(
 
 logger = get_logger(__name__)
 
-async def get_extraction_manager():
-    """Dependency to get extraction manager instance."""
-    settings = get_settings()
-    try:
-        manager = ExtractionManager(
-            openai_api_key=settings.OPENAI_API_KEY
-        )
-        yield manager
-    except Exception as e:
-        logger.error(f"Error creating ExtractionManager: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Could not initialize extraction service: {str(e)}"
-        )
-
 
 @router.post(
     "/extract",
@@ -47,66 +33,35 @@ async def get_extraction_manager():
     summary="Extract meeting data from text",
     description="Analyze text and extract structured meeting data"
 )
+@handle_route_errors
 async def extract_meeting_data(
     request: Request,
-    text: str = Body(..., embed=True),
-    customer_hint: Optional[str] = Body(None, embed=True),
-    meeting_date_hint: Optional[str] = Body(None, embed=True),
+    body: ExtractRequest,
     extraction_manager: ExtractionManager = Depends(get_extraction_manager)
 ):
     """
     Extract meeting data from text.
     
     Args:
-        text: Text to extract meeting data from
-        customer_hint: Optional hint about the customer name
-        meeting_date_hint: Optional hint about the meeting date
+        body: Text to extract meeting data from, with optional customer and
+            meeting date hints
         extraction_manager: ExtractionManager instance
         
     Returns:
         Extracted meeting data
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
-    logger.info(f"[{request_id}] Extracting meeting data from text ({len(text)} chars)")
+    request_id = getattr(request.state, "request_id", None) or generate_request_id()
+    logger.info(f"[{request_id}] Extracting meeting data from text ({len(body.text)} chars)")
     
-    try:
-        # Add hints to the text if provided
-        extraction_text = text
-        
-        if customer_hint or meeting_date_hint:
-            hint_text = "Additional information: "
-            if customer_hint:
-                hint_text += f"Customer is {customer_hint}. "
-            if meeting_date_hint:
-                hint_text += f"Meeting date is {meeting_date_hint}."
-            
-            extraction_text = f"{text}\n\n{hint_text}"
-        
-        # Extract meeting data
-        meeting_data = await extraction_manager.extract(extraction_text)
-        
-        # Return the results
-        return MeetingDataResponse(
-            meeting_data=meeting_data,
-            extraction_status=meeting_data.get("extraction_status", "unknown"),
-            timestamp=meeting_data.get("timestamp", "")
-        )
-        
-    except BaseAppException as e:
-        logger.error(f"[{request_id}] Application error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": str(e),
-                "error_code": e.code_value,
-                "error_details": e.details,
-                "request_id": request_id
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"[{request_id}] Unexpected error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {str(e)}"
-        )
\ No newline at end of file
+    # Add hints to the text if provided
+    extraction_text = add_extraction_hints(body.text, body.customer_hint, body.meeting_date_hint)
+    
+    # Extract meeting data
+    meeting_data = await extraction_manager.extract(extraction_text)
+    
+    # Return the results
+    return model_response(MeetingDataResponse(
+        meeting_data=meeting_data,
+        extraction_status=meeting_data.get("extraction_status", "unknown"),
+        timestamp=meeting_data.get("timestamp", "")
+    ))
\ No newline at end of file
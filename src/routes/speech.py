@@ -3,27 +3,35 @@ Speech processing related routes for handling audio uploads and transcription.
 """
 
 from fastapi import APIRouter, UploadFile, File, Form, Depends, BackgroundTasks, HTTPException, Request
-from fastapi.responses import JSONResponse
-from typing import Optional
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict, Any
 import os
-import uuid
+import asyncio
 from datetime import datetime
 
 from config.config import get_settings
-from src.models.api import VoiceUploadRequest, TranscriptionResponse, ErrorResponse
+from src.models.api import TranscriptionResponse, ErrorResponse
 from src.models.meeting import ProcessingResponse
 from src.services.speech import SpeechManager
 from src.services.extraction import ExtractionManager
 from src.services.storage import StorageManager
 from src.services.notification import NotificationManager
-from src.utils import get_logger, ErrorCode, TranscriptionError, ExtractionError
-from src.utils.exceptions import BaseAppException, StorageError
+from src.routes.base import API_V1_PREFIX, model_response, add_extraction_hints, handle_route_errors
+from src.routes.dependencies import (
+    get_speech_manager,
+    get_extraction_manager,
+    get_storage_manager,
+    get_notification_manager
+)
+from src.utils import get_logger, generate_request_id, ErrorCode, TranscriptionError, ExtractionError
+from src.utils.exceptions import StorageError
 from src.enums import ProcessingStatus, StorageStatus
 from src.enums.notification import NotificationStatus
 
 # Setup router
 router = APIRouter(
-    prefix="/speech",
+    prefix=f"{API_V1_PREFIX}/speech",
+    default_response_class=ORJSONResponse,
     tags=["speech"],
     responses={
         400: {"model": ErrorResponse},
@@ -33,64 +41,199 @@ router = APIRouter(
 
 logger = get_logger(__name__)
 
-async def get_speech_manager():
-    """Dependency to get speech manager instance."""
-    settings = get_settings()
-    try:
-        manager = SpeechManager(
-            openai_api_key=settings.OPENAI_API_KEY,
-            storage_dir=settings.TEMP_DIR
-        )
-        yield manager
-    except Exception as e:
-        logger.error(f"Error creating SpeechManager: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Could not initialize speech service: {str(e)}"
-        )
+# Settings are fixed for the life of the process
+settings = get_settings()
 
-async def get_extraction_manager():
-    """Dependency to get extraction manager instance."""
-    settings = get_settings()
-    try:
-        manager = ExtractionManager(
-            openai_api_key=settings.OPENAI_API_KEY
-        )
-        yield manager
-    except Exception as e:
-        logger.error(f"Error creating ExtractionManager: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Could not initialize extraction service: {str(e)}"
-        )
+# Audio formats accepted by the upload endpoints
+SUPPORTED_UPLOAD_FORMATS = ("mp3", "wav", "m4a", "mpeg", "mpga", "webm")
+_SUPPORTED_UPLOAD_SUFFIXES = tuple(f".{fmt}" for fmt in SUPPORTED_UPLOAD_FORMATS)
+_SUPPORTED_UPLOAD_FORMATS_STR = ", ".join(SUPPORTED_UPLOAD_FORMATS)
 
-async def get_storage_manager():
-    """Dependency to get storage manager instance."""
-    settings = get_settings()
-    try:
-        manager = StorageManager(
-            google_credentials_file=settings.GOOGLE_CREDENTIALS_FILE,
-            google_spreadsheet_id=settings.GOOGLE_SPREADSHEET_ID
+
+def _upload_size(file: UploadFile) -> int:
+    """
+    Get the size of an uploaded file in bytes.
+    
+    The upload is already spooled by the multipart parser, so this uses the
+    recorded size (or seeks) instead of reading the content into memory.
+    """
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
+
+def _check_upload_format(filename: Optional[str]) -> None:
+    """
+    Reject uploads whose filename doesn't have a supported audio extension.
+    
+    Raises:
+        HTTPException: 400 if the format isn't supported
+    """
+    # One case-insensitive suffix test; the extension is only split out
+    # for the error message
+    if filename and filename.lower().endswith(_SUPPORTED_UPLOAD_SUFFIXES):
+        return
+    file_ext = os.path.splitext(filename)[1] if filename else ""
+    raise HTTPException(
+        status_code=400,
+        detail=f"Unsupported file format: {file_ext}. Supported formats: {_SUPPORTED_UPLOAD_FORMATS_STR}"
+    )
+
+
+def _record_storage_outcome(request_id: str, meeting_data: Dict[str, Any], outcome: Any) -> None:
+    """
+    Record a storage result (or StorageError) on the meeting data.
+    
+    Args:
+        request_id: ID of the upload request, for logging
+        meeting_data: Meeting data to update
+        outcome: Result of store_meeting_data, or the exception it raised
+        
+    Raises:
+        BaseException: Any exception other than StorageError is re-raised
+    """
+    if isinstance(outcome, StorageError):
+        logger.warning(f"[{request_id}] Storage error (continuing): {str(outcome)}")
+        meeting_data["storage_status"] = StorageStatus.FAILED.value
+        meeting_data["storage_error"] = str(outcome)
+    elif isinstance(outcome, BaseException):
+        raise outcome
+    else:
+        meeting_data["storage_status"] = outcome.get("storage_status")
+
+
+def _record_notification_outcome(request_id: str, meeting_data: Dict[str, Any], outcome: Any) -> None:
+    """
+    Record a notification result (or error) on the meeting data.
+    
+    Args:
+        request_id: ID of the upload request, for logging
+        meeting_data: Meeting data to update
+        outcome: Result of send_notification, or the exception it raised
+        
+    Raises:
+        BaseException: Non-Exception errors (e.g. cancellation) are re-raised
+    """
+    if isinstance(outcome, Exception):
+        logger.warning(f"[{request_id}] Notification error (continuing): {str(outcome)}")
+        meeting_data["notification_status"] = NotificationStatus.FAILED.value
+        meeting_data["notification_error"] = str(outcome)
+    elif isinstance(outcome, BaseException):
+        raise outcome
+    else:
+        meeting_data["notification_status"] = outcome.get("overall_status")
+        meeting_data["notification_channels"] = outcome.get("channels", [])
+
+
+async def _process_upload(
+    request_id: str,
+    audio_path: str,
+    customer_hint: Optional[str],
+    meeting_date_hint: Optional[str],
+    should_notify: bool,
+    speech_manager: SpeechManager,
+    extraction_manager: ExtractionManager,
+    storage_manager: StorageManager,
+    notification_manager: NotificationManager
+) -> ProcessingResponse:
+    """
+    Transcribe a saved upload, extract meeting data, store it, and notify.
+    
+    Args:
+        request_id: ID of the upload request, for logging
+        audio_path: Path to the saved audio file
+        customer_hint: Optional hint about the customer name
+        meeting_date_hint: Optional hint about the meeting date
+        should_notify: Whether to send notifications after storing
+        speech_manager: SpeechManager instance
+        extraction_manager: ExtractionManager instance
+        storage_manager: StorageManager instance
+        notification_manager: NotificationManager instance
+        
+    Returns:
+        Processing response with the meeting data
+    """
+    transcription_result = await speech_manager.transcribe_audio_file(audio_path, copy_to_storage=False)
+    
+    if transcription_result.get("processing_status") != "completed":
+        return ProcessingResponse(
+            success=False,
+            message=f"Transcription failed: {transcription_result.get('error', 'Unknown error')}",
+            data=None
         )
-        yield manager
-    except Exception as e:
-        logger.error(f"Error creating StorageManager: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Could not initialize storage service: {str(e)}"
+    
+    # Extract meeting data from transcription
+    transcribed_text = transcription_result.get("text", "")
+    
+    # Add hints to the text if provided
+    transcribed_text = add_extraction_hints(transcribed_text, customer_hint, meeting_date_hint)
+    
+    # Extract meeting data
+    meeting_data = await extraction_manager.extract(transcribed_text)
+    
+    notify_now = should_notify and (settings.ENABLE_EMAIL_NOTIFICATIONS or settings.ENABLE_SLACK_NOTIFICATIONS)
+    
+    if notify_now and settings.PARALLEL_STORAGE_AND_NOTIFICATIONS:
+        # Store and notify at the same time; notifications don't wait for
+        # (or depend on) the storage result
+        storage_outcome, notification_outcome = await asyncio.gather(
+            storage_manager.store_meeting_data(meeting_data),
+            # Pass a copy, since storage fills in missing fields while both run
+            notification_manager.send_notification(dict(meeting_data)),
+            return_exceptions=True
         )
+        _record_storage_outcome(request_id, meeting_data, storage_outcome)
+        _record_notification_outcome(request_id, meeting_data, notification_outcome)
+    else:
+        # Store meeting data
+        try:
+            storage_outcome = await storage_manager.store_meeting_data(meeting_data)
+        except StorageError as e:
+            storage_outcome = e
+        _record_storage_outcome(request_id, meeting_data, storage_outcome)
+        
+        # notification logic
+        if meeting_data.get("storage_status") == StorageStatus.STORED.value:
+            if notify_now:
+                try:
+                    notification_outcome = await notification_manager.send_notification(meeting_data)
+                except Exception as e:
+                    notification_outcome = e
+                _record_notification_outcome(request_id, meeting_data, notification_outcome)
+            else:
+                meeting_data["notification_status"] = NotificationStatus.SKIPPED.value
+                if not should_notify:
+                    meeting_data["notification_message"] = "Notifications not requested"
+                else:
+                    meeting_data["notification_message"] = "No notification channels enabled"
+    
+    # Return the results
+    return ProcessingResponse(
+        success=True,
+        message="Audio processed and data stored successfully",
+        data=meeting_data
+    )
+
+
+async def _process_upload_in_background(processing_id: str, *pipeline_args) -> None:
+    """
+    Run _process_upload after the response has been sent.
     
-async def get_notification_manager():
-    """Dependency to get notification manager instance."""
+    Errors are logged rather than raised, since there is no request left
+    to report them to.
+    
+    Args:
+        processing_id: Processing ID returned to the client
+        pipeline_args: Arguments for _process_upload
+    """
     try:
-        manager = NotificationManager()
-        yield manager
+        response = await _process_upload(*pipeline_args)
+        logger.info(f"[{processing_id}] Background processing finished: {response.message}")
     except Exception as e:
-        logger.error(f"Error creating NotificationManager: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Could not initialize notification service: {str(e)}"
-        )
+        logger.error(f"[{processing_id}] Background processing failed: {str(e)}", exc_info=True)
 
 
 @router.post(
@@ -99,6 +242,7 @@ async def get_notification_manager():
     summary="Upload and process an audio recording",
     description="Upload an audio recording of a meeting summary, transcribe it, and extract meeting details"
 )
+@handle_route_errors
 async def upload_audio(
     request: Request,
     background_tasks: BackgroundTasks,
@@ -127,127 +271,55 @@ async def upload_audio(
     Returns:
         Processed meeting data
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
+    request_id = getattr(request.state, "request_id", None) or generate_request_id()
     logger.info(f"[{request_id}] Processing audio upload: {file.filename}")
     
-    # Get settings
-    settings = get_settings()
-    
     # Determine if notifications should be sent
     # If notify param is explicitly provided, use it; otherwise use the default from settings
     should_notify = notify if notify is not None else settings.NOTIFICATIONS_DEFAULT
     
-    try:
-        # Validate file extension
-        file_ext = os.path.splitext(file.filename)[1].lower() if file.filename else ""
-        if not file_ext or file_ext.lstrip(".") not in ["mp3", "wav", "m4a", "mpeg", "mpga", "webm"]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file format: {file_ext}. Supported formats: mp3, wav, m4a, mpeg, mpga, webm"
-            )
-        
-        # Read file content
-        file_content = await file.read()
-        if not file_content:
-            raise HTTPException(
-                status_code=400,
-                detail="Uploaded file is empty"
-            )
-        
-        # Process audio in the background if it's large
-        if len(file_content) > 5 * 1024 * 1024:  # If file > 5MB
-            # Schedule background processing
-            processing_id = f"upload_{datetime.now().strftime('%Y%m%d%H%M%S')}_{request_id}"
-            
-            # Return immediate response
-            return ProcessingResponse(
-                success=True,
-                message=f"Audio upload received ({len(file_content)} bytes). Processing in background. Check status with processing ID: {processing_id}",
-                data=None
-            )
-        
-        # For smaller files, process immediately
-        transcription_result = await speech_manager.transcribe_audio_data(file_content)
-        
-        if transcription_result.get("processing_status") != "completed":
-            return ProcessingResponse(
-                success=False,
-                message=f"Transcription failed: {transcription_result.get('error', 'Unknown error')}",
-                data=None
-            )
-        
-        # Extract meeting data from transcription
-        transcribed_text = transcription_result.get("text", "")
-        
-        # Add hints to the text if provided
-        if customer_hint or meeting_date_hint:
-            hint_text = "Additional information: "
-            if customer_hint:
-                hint_text += f"Customer is {customer_hint}. "
-            if meeting_date_hint:
-                hint_text += f"Meeting date is {meeting_date_hint}."
-            
-            transcribed_text = f"{transcribed_text}\n\n{hint_text}"
-        
-        # Extract meeting data
-        meeting_data = await extraction_manager.extract(transcribed_text)
-        
-        # Store meeting data
-        try:
-            storage_result = await storage_manager.store_meeting_data(meeting_data)
-            meeting_data["storage_status"] = storage_result.get("storage_status")
-        except StorageError as e:
-            logger.warning(f"[{request_id}] Storage error (continuing): {str(e)}")
-            meeting_data["storage_status"] = StorageStatus.FAILED.value
-            meeting_data["storage_error"] = str(e)
-
-        # notification logic
-        if meeting_data.get("storage_status") == StorageStatus.STORED.value:
-            if should_notify and (settings.ENABLE_EMAIL_NOTIFICATIONS or settings.ENABLE_SLACK_NOTIFICATIONS):
-                try:
-                    notification_result = await notification_manager.send_notification(meeting_data)
-                    meeting_data["notification_status"] = notification_result.get("overall_status")
-                    meeting_data["notification_channels"] = notification_result.get("channels", [])
-                except Exception as e:
-                    logger.warning(f"[{request_id}] Notification error (continuing): {str(e)}")
-                    meeting_data["notification_status"] = NotificationStatus.FAILED.value
-                    meeting_data["notification_error"] = str(e)
-            else:
-                meeting_data["notification_status"] = NotificationStatus.SKIPPED.value
-                if not should_notify:
-                    meeting_data["notification_message"] = "Notifications not requested"
-                elif not (settings.ENABLE_EMAIL_NOTIFICATIONS or settings.ENABLE_SLACK_NOTIFICATIONS):
-                    meeting_data["notification_message"] = "No notification channels enabled"
-        
-        # Return the results
-        return ProcessingResponse(
-            success=True,
-            message="Audio processed and data stored successfully",
-            data=meeting_data
-        )
-            
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-        
-    except BaseAppException as e:
-        logger.error(f"[{request_id}] Application error: {str(e)}", exc_info=True)
+    # Validate file extension
+    _check_upload_format(file.filename)
+    
+    # Check the upload size without reading it into memory
+    file_size = _upload_size(file)
+    if not file_size:
         raise HTTPException(
-            status_code=500,
-            detail={
-                "error": str(e),
-                "error_code": e.code_value,
-                "error_details": e.details,
-                "request_id": request_id
-            }
+            status_code=400,
+            detail="Uploaded file is empty"
         )
+    
+    # The upload is closed when the request finishes, so save it to
+    # storage first; the pipeline works from the saved file
+    audio_path = await speech_manager.save_audio_data(file.file)
+    
+    pipeline_args = (
+        request_id,
+        audio_path,
+        customer_hint,
+        meeting_date_hint,
+        should_notify,
+        speech_manager,
+        extraction_manager,
+        storage_manager,
+        notification_manager
+    )
+    
+    # Process audio in the background if it's large
+    if file_size > 5 * 1024 * 1024:  # If file > 5MB
+        # Schedule background processing
+        processing_id = f"upload_{datetime.now().strftime('%Y%m%d%H%M%S')}_{request_id}"
+        background_tasks.add_task(_process_upload_in_background, processing_id, *pipeline_args)
         
-    except Exception as e:
-        logger.error(f"[{request_id}] Unexpected error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {str(e)}"
-        )
+        # Return immediate response
+        return model_response(ProcessingResponse(
+            success=True,
+            message=f"Audio upload received ({file_size} bytes). Processing in background. Check status with processing ID: {processing_id}",
+            data=None
+        ))
+    
+    # For smaller files, process immediately
+    return model_response(await _process_upload(*pipeline_args))
 
 
 @router.post(
@@ -256,6 +328,7 @@ async def upload_audio(
     summary="Transcribe audio without extraction",
     description="Upload an audio file and get the transcribed text without extracting meeting details"
 )
+@handle_route_errors
 async def transcribe_audio(
     request: Request,
     file: UploadFile = File(...),
@@ -271,48 +344,30 @@ async def transcribe_audio(
     Returns:
         Transcription results
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
+    request_id = getattr(request.state, "request_id", None) or generate_request_id()
     logger.info(f"[{request_id}] Transcribing audio: {file.filename}")
     
-    try:
-        # Read file content
-        file_content = await file.read()
-        if not file_content:
-            raise HTTPException(
-                status_code=400,
-                detail="Uploaded file is empty"
-            )
-        
-        # Transcribe the audio
-        transcription_result = await speech_manager.transcribe_audio_data(file_content)
-        
-        return transcription_result
-        
-    except BaseAppException as e:
-        logger.error(f"[{request_id}] Application error: {str(e)}", exc_info=True)
+    # Check the upload size without reading it into memory
+    file_size = _upload_size(file)
+    if not file_size:
         raise HTTPException(
-            status_code=500,
-            detail={
-                "error": str(e),
-                "error_code": e.code_value,
-                "error_details": e.details,
-                "request_id": request_id
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"[{request_id}] Unexpected error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {str(e)}"
+            status_code=400,
+            detail="Uploaded file is empty"
         )
     
+    # Transcribe the audio
+    transcription_result = await speech_manager.transcribe_audio_data(file.file)
+    
+    return model_response(TranscriptionResponse(**transcription_result))
+
+
 @router.post(
     "/process",
     response_model=ProcessingResponse,
     summary="Process an audio recording without storage or notifications",
     description="Upload an audio recording, transcribe it, and extract meeting details without storing or sending notifications"
 )
+@handle_route_errors
 async def process_audio(
     request: Request,
     file: UploadFile = File(...),
@@ -334,74 +389,39 @@ async def process_audio(
     Returns:
         Processed meeting data (without storage or notification)
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
+    request_id = getattr(request.state, "request_id", None) or generate_request_id()
     logger.info(f"[{request_id}] Processing audio: {file.filename}")
     
-    try:
-        file_ext = os.path.splitext(file.filename)[1].lower() if file.filename else ""
-        if not file_ext or file_ext.lstrip(".") not in ["mp3", "wav", "m4a", "mpeg", "mpga", "webm"]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file format: {file_ext}. Supported formats: mp3, wav, m4a, mpeg, mpga, webm"
-            )
-        
-        file_content = await file.read()
-        if not file_content:
-            raise HTTPException(
-                status_code=400,
-                detail="Uploaded file is empty"
-            )
-        
-        # Transcribe the audio
-        transcription_result = await speech_manager.transcribe_audio_data(file_content)
-        
-        if transcription_result.get("processing_status") != "completed":
-            return ProcessingResponse(
-                success=False,
-                message=f"Transcription failed: {transcription_result.get('error', 'Unknown error')}",
-                data=None
-            )
-        
-        # Extract meeting data from transcription
-        transcribed_text = transcription_result.get("text", "")
-        
-        if customer_hint or meeting_date_hint:
-            hint_text = "Additional information: "
-            if customer_hint:
-                hint_text += f"Customer is {customer_hint}. "
-            if meeting_date_hint:
-                hint_text += f"Meeting date is {meeting_date_hint}."
-            
-            transcribed_text = f"{transcribed_text}\n\n{hint_text}"
-        
-        # Extract meeting data
-        meeting_data = await extraction_manager.extract(transcribed_text)
-        
-        return ProcessingResponse(
-            success=True,
-            message="Audio processed successfully",
-            data=meeting_data
-        )
-            
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-        
-    except BaseAppException as e:
-        logger.error(f"[{request_id}] Application error: {str(e)}", exc_info=True)
+    _check_upload_format(file.filename)
+    
+    # Check the upload size without reading it into memory
+    file_size = _upload_size(file)
+    if not file_size:
         raise HTTPException(
-            status_code=500,
-            detail={
-                "error": str(e),
-                "error_code": e.code_value,
-                "error_details": e.details,
-                "request_id": request_id
-            }
+            status_code=400,
+            detail="Uploaded file is empty"
         )
-        
-    except Exception as e:
-        logger.error(f"[{request_id}] Unexpected error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {str(e)}"
-        )
\ No newline at end of file
+    
+    # Transcribe the audio
+    transcription_result = await speech_manager.transcribe_audio_data(file.file)
+    
+    if transcription_result.get("processing_status") != "completed":
+        return model_response(ProcessingResponse(
+            success=False,
+            message=f"Transcription failed: {transcription_result.get('error', 'Unknown error')}",
+            data=None
+        ))
+    
+    # Extract meeting data from transcription
+    transcribed_text = transcription_result.get("text", "")
+    
+    transcribed_text = add_extraction_hints(transcribed_text, customer_hint, meeting_date_hint)
+    
+    # Extract meeting data
+    meeting_data = await extraction_manager.extract(transcribed_text)
+    
+    return model_response(ProcessingResponse(
+        success=True,
+        message="Audio processed successfully",
+        data=meeting_data
+    ))
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+In-memory cache for LLM extraction results.
+Lets repeated extraction requests (retries, re-runs, re-uploads of the same
+recording) skip the OpenAI API call.
+"""
+
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class ExtractionCache:
+    """
+    LRU cache of extraction results keyed by the exact request sent to the LLM.
+    
+    The key covers everything that affects the model's answer (model, system
+    prompt, date context and text), so a hit is only possible for a request
+    the model has already answered. All access happens on the event loop, so
+    no locking is needed.
+    """
+    
+    def __init__(self, maxsize: int = 1000):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of results to keep before evicting the
+                least recently used one
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(model: str, system_prompt: str, date_context: str, text: str) -> str:
+        """
+        Build the cache key for an extraction request.
+        
+        Args:
+            model: LLM model name
+            system_prompt: Static system prompt
+            date_context: Per-day date context message
+            text: Text to extract meeting data from
+        
+        Returns:
+            SHA-256 hex digest of the request
+        """
+        payload = json.dumps(
+            {"model": model, "system": system_prompt, "date": date_context, "text": text},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return dict(entry)
+    
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a result, evicting the least recently used one if full.
+        
+        Args:
+            key: Cache key from make_key()
+            result: Extracted fields to cache (a copy is stored)
+        """
+        self._entries[key] = dict(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
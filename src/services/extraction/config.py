@@ -3,35 +3,91 @@ Configuration for extraction services.
 Separates configuration from implementation for better maintainability.
 """
 
-from datetime import datetime
+from datetime import date, timedelta
 
-# Get current date for relative date calculations
-CURRENT_DATE = datetime.now().strftime("%Y-%m-%d")
-
-# System prompts for different extraction strategies
+# System prompts for different extraction strategies. These are kept free of
+# anything that changes per request or per day, so every request shares the
+# same prompt prefix (which lets OpenAI's automatic prompt caching reuse it);
+# today's date is sent in a separate message built by build_date_context().
 EXTRACTION_PROMPTS = {
-    "meeting_data": f"""
+    "meeting_data": """
     You are an AI assistant specialized in extracting structured meeting data from text.
-    Today's date is {CURRENT_DATE}.
+    Today's date is given in a separate message.
     
     Given a transcription of someone describing a meeting, extract the following information:
     
     1. Customer/Client Name: The company or organization name (avoid including dates or other info here)
-    2. Meeting Date: In YYYY-MM-DD format. Handle relative dates like "today" or "yesterday" based on today's date of {CURRENT_DATE}.
+    2. Meeting Date: In YYYY-MM-DD format. Handle relative dates like "today" or "yesterday" based on today's date.
     3. Start Time: The time the meeting started (in format like "10:00 AM" or "14:30")
     4. End Time: The time the meeting ended (in format like "11:00 AM" or "15:45")
     5. Total Hours: Duration in hours and minutes, formatted as "Xh Ym" (e.g., "1h 30m" or "0h 45m")
     6. Notes: Any other relevant information about the meeting
     
     Format your response as a JSON object with these exact keys:
-    {{"customer_name": string, "meeting_date": string, "start_time": string, "end_time": string, "total_hours": string, "notes": string}}
+    {"customer_name": string, "meeting_date": string, "start_time": string, "end_time": string, "total_hours": string, "notes": string}
     
     If any field is missing in the text, use null for that field. For total_hours, calculate from start and end times if both are provided, and format as "Xh Ym".
-    For dates, when you see "yesterday", that means {(datetime.now().replace(day=datetime.now().day-1)).strftime("%Y-%m-%d")}.
-    When you see "today", that means {CURRENT_DATE}.
     """
 }
 
+
+def build_date_context(today: date) -> str:
+    """
+    Build the message that tells the model which dates "today" and
+    "yesterday" refer to.
+    
+    Args:
+        today: The current date
+        
+    Returns:
+        Date context to send after the static system prompt
+    """
+    yesterday = today - timedelta(days=1)
+    return (
+        f"Today's date is {today:%Y-%m-%d}. "
+        f'When you see "yesterday", that means {yesterday:%Y-%m-%d}. '
+        f'When you see "today", that means {today:%Y-%m-%d}.'
+    )
+
+# Fields the LLM is asked to return
+LLM_RESPONSE_FIELDS = ("customer_name", "meeting_date", "start_time", "end_time", "total_hours", "notes")
+
+# Structured-output schema for the meeting_data response. Strict mode makes
+# the model return exactly these keys, each a string or null.
+MEETING_DATA_SCHEMA = {
+    "name": "meeting_data",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            field_name: {"type": ["string", "null"]} for field_name in LLM_RESPONSE_FIELDS
+        },
+        "required": list(LLM_RESPONSE_FIELDS),
+        "additionalProperties": False
+    }
+}
+
+# Models known to accept json_schema structured outputs together with the
+# temperature setting used for extraction. Matched by exact name, since older
+# snapshots of the same family (e.g. gpt-4o-2024-05-13) reject json_schema;
+# any other model gets plain JSON mode.
+STRUCTURED_OUTPUT_MODELS = frozenset({
+    "gpt-4o",
+    "gpt-4o-2024-08-06",
+    "gpt-4o-2024-11-20",
+    "gpt-4o-mini",
+    "gpt-4o-mini-2024-07-18",
+    "gpt-4.1",
+    "gpt-4.1-2025-04-14",
+    "gpt-4.1-mini",
+    "gpt-4.1-mini-2025-04-14",
+    "gpt-4.1-nano",
+    "gpt-4.1-nano-2025-04-14",
+})
+
+# Tokens budgeted for an extraction reply when rate limiting
+ESTIMATED_RESPONSE_TOKENS = 200
+
 # Default result structure
 DEFAULT_MEETING_DATA = {
     "customer_name": None,
@@ -44,4 +100,13 @@ DEFAULT_MEETING_DATA = {
 }
 
 # Required fields for a complete extraction
-REQUIRED_MEETING_FIELDS = ["customer_name", "total_hours"]
\ No newline at end of file
+REQUIRED_MEETING_FIELDS = ["customer_name", "total_hours"]
+
+# Maximum number of extraction requests in flight at once for a batch
+MAX_CONCURRENT_EXTRACTIONS = 5
+
+# Longest text (in characters, roughly 4 per token) sent to the LLM. Longer
+# transcriptions keep their start and their end, where the details and any
+# extraction hints usually are; the middle is dropped.
+MAX_LLM_INPUT_CHARS = 12000
+LLM_INPUT_HEAD_CHARS = 2000
\ No newline at end of file
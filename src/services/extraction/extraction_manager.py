@@ -2,12 +2,21 @@
 Extraction manager that handles meeting data extraction.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime
+import asyncio
+import hashlib
+import itertools
+import json
+import os
 import uuid
 
 from config.config import get_settings
-from src.services.extraction.config import DEFAULT_MEETING_DATA, REQUIRED_MEETING_FIELDS
+from src.services.extraction.config import (
+    DEFAULT_MEETING_DATA,
+    REQUIRED_MEETING_FIELDS,
+    MAX_CONCURRENT_EXTRACTIONS
+)
 from src.utils import (
     get_logger,
     log_async_function_call,
@@ -23,6 +32,73 @@ from src.enums import ExtractionStatus
 
 logger = get_logger(__name__)
 
+# Sequence for extraction IDs
+_EXTRACTION_IDS = itertools.count(1)
+
+
+def _load_checkpoint(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the results saved in a batch extraction checkpoint file.
+    
+    A last line left half-written by an interrupted run is skipped and
+    terminated, so results appended after it start on a line of their own.
+    
+    Args:
+        path: JSONL checkpoint file (may not exist yet)
+        
+    Returns:
+        Saved results keyed by input hash
+    """
+    done = {}
+    if not os.path.exists(path):
+        return done
+    
+    line = ""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+                done[row["input_hash"]] = row["result"]
+            except (ValueError, KeyError, TypeError):
+                # Skip a line left half-written by an interrupted run
+                continue
+    
+    if line and not line.endswith("\n"):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n")
+    return done
+
+
+def _checkpoint_key(model: str, text: str) -> str:
+    """
+    Build the checkpoint key for an extraction.
+    
+    The model is part of the key, so resuming after a model change
+    extracts the texts again rather than reusing the old model's results.
+    
+    Args:
+        model: LLM model the text is extracted with
+        text: Text to extract meeting data from
+        
+    Returns:
+        SHA-256 hex digest of the model and text
+    """
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _append_checkpoint(path: str, input_hash: str, result: Dict[str, Any]) -> None:
+    """
+    Append one extraction result to a batch extraction checkpoint file.
+    
+    Args:
+        path: JSONL checkpoint file
+        input_hash: Checkpoint key from _checkpoint_key()
+        result: Extraction result
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"input_hash": input_hash, "result": result}) + "\n")
+
+
 class ExtractionManager:
     """
     Manager class for extracting structured meeting data from text.
@@ -90,7 +166,7 @@ class ExtractionManager:
             InsufficientDataError: If extracted data is incomplete
         """
         # Create an extraction ID to trace this specific extraction request
-        extraction_id = f"extract_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        extraction_id = f"extract_{next(_EXTRACTION_IDS)}"
         
         # Initialize with default values
         result = DEFAULT_MEETING_DATA.copy()
@@ -126,12 +202,13 @@ class ExtractionManager:
                 )
             )
             
-            llm_result = await self._llm_extractor.extract(text)
+            llm_result = await self._llm_extractor.extract(text, extraction_id=extraction_id)
             
             # Update our result with the extracted data
-            for key in DEFAULT_MEETING_DATA.keys():
-                if key in llm_result and llm_result[key] is not None:
-                    result[key] = llm_result[key]
+            result.update({
+                key: value for key, value in llm_result.items()
+                if key in DEFAULT_MEETING_DATA and value is not None
+            })
             
             if self._is_complete_extraction(result):
                 result["extraction_status"] = ExtractionStatus.COMPLETE.value
@@ -207,6 +284,81 @@ class ExtractionManager:
         
         return result
     
+    async def close(self) -> None:
+        """
+        Close the LLM extractor's OpenAI client.
+        
+        The client's connections belong to the event loop that used them, so
+        a later extraction builds a new extractor rather than reusing it.
+        """
+        if self._llm_extractor:
+            llm_extractor, self._llm_extractor = self._llm_extractor, None
+            await llm_extractor.close()
+    
+    async def extract_batch(
+        self,
+        texts: List[str],
+        max_concurrency: int = MAX_CONCURRENT_EXTRACTIONS,
+        checkpoint_path: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract meeting data from several texts concurrently.
+        
+        The extractions are network-bound, so running them side by side
+        takes roughly as long as the slowest one instead of the sum. A
+        semaphore keeps at most max_concurrency requests in flight.
+        
+        With a checkpoint file, every extraction that doesn't fail is
+        appended to it as a JSON line keyed by the SHA-256 of its model and
+        text, and texts already in the file for the same model are answered
+        from it. Re-running a batch that was interrupted then only extracts
+        the remaining texts.
+        
+        Args:
+            texts: Transcribed meeting texts
+            max_concurrency: Maximum number of extractions running at once
+            checkpoint_path: Optional JSONL file to resume from and append to
+            
+        Returns:
+            One result per text, in the same order. A failed extraction is
+            reported through its extraction_status and extraction_error
+            fields, as with extract().
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        checkpoint_lock = asyncio.Lock()
+        done = await asyncio.to_thread(_load_checkpoint, checkpoint_path) if checkpoint_path else {}
+        model = self.model or get_settings().DEFAULT_LLM_MODEL
+        input_hashes = [_checkpoint_key(model, text) for text in texts]
+        
+        async def extract_one(text: str, input_hash: str) -> Dict[str, Any]:
+            if input_hash in done:
+                return dict(done[input_hash])
+            
+            async with semaphore:
+                result = await self.extract(text)
+            
+            if checkpoint_path and result.get("extraction_status") != ExtractionStatus.FAILED.value:
+                # One writer at a time so lines from concurrent items don't interleave
+                async with checkpoint_lock:
+                    await asyncio.to_thread(_append_checkpoint, checkpoint_path, input_hash, result)
+            return result
+        
+        logger.info(
+            format_structured_log(
+                "Starting batch extraction",
+                {
+                    "batch_size": len(texts),
+                    "already_done": sum(1 for input_hash in input_hashes if input_hash in done),
+                    "max_concurrency": max_concurrency,
+                    "instance_id": self.instance_id
+                }
+            )
+        )
+        
+        return list(await asyncio.gather(*(
+            extract_one(text, input_hash) for text, input_hash in zip(texts, input_hashes)
+        )))
+    
     def _is_complete_extraction(self, result: Dict[str, Any]) -> bool:
         """
         Check if the extraction result has all required fields.
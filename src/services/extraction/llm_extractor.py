@@ -3,20 +3,28 @@ Modern LLM-based extraction using the OpenAI API.
 This implementation is compatible with OpenAI SDK 1.x.
 """
 
-import json
-import asyncio
+import itertools
 import re
-from typing import Dict, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, Any, Optional, Union, List, Tuple
+from datetime import datetime, date
 from dateutil import parser
-from openai import OpenAI
-from openai import OpenAIError
+import orjson
+from openai import AsyncOpenAI
+from openai import OpenAIError, RateLimitError, APITimeoutError
 
 from config.config import get_settings
 from src.services.extraction.config import (
     EXTRACTION_PROMPTS,
-    DEFAULT_MEETING_DATA
+    DEFAULT_MEETING_DATA,
+    MAX_LLM_INPUT_CHARS,
+    LLM_INPUT_HEAD_CHARS,
+    MEETING_DATA_SCHEMA,
+    STRUCTURED_OUTPUT_MODELS,
+    ESTIMATED_RESPONSE_TOKENS,
+    build_date_context
 )
+from src.services.extraction.cache import ExtractionCache
+from src.services.extraction.rate_limiter import TokenBucketLimiter
 from src.utils import (
     get_logger, 
     log_async_function_call,
@@ -31,16 +39,91 @@ from src.enums import ExtractionStatus
 
 logger = get_logger(__name__)
 
+# Durations already in the "Xh Ym" format, and the leading number of any other duration
+_DURATION_RE = re.compile(r'^\d+h\s+\d+m$')
+_LEADING_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+
+
+# System message for meeting data extraction; static, so it's built once and
+# shared by every request
+_SYSTEM_MESSAGE = {"role": "system", "content": EXTRACTION_PROMPTS["meeting_data"]}
+
+# Sequence for IDs of extractions started without one (unique per process,
+# unlike a timestamp, which repeats for requests within the same second)
+_EXTRACTION_IDS = itertools.count(1)
+
+
+def _trim_for_llm(text: str) -> str:
+    """
+    Cap the text sent to the LLM at MAX_LLM_INPUT_CHARS.
+    
+    Args:
+        text: Full transcription text
+        
+    Returns:
+        The text unchanged if it fits, otherwise its start and end with the
+        middle replaced by an ellipsis
+    """
+    if len(text) <= MAX_LLM_INPUT_CHARS:
+        return text
+    tail_chars = MAX_LLM_INPUT_CHARS - LLM_INPUT_HEAD_CHARS
+    return f"{text[:LLM_INPUT_HEAD_CHARS]}\n...\n{text[-tail_chars:]}"
+
+
+def _hours_to_duration(hours_value: float) -> str:
+    """
+    Format a number of hours as "Xh Ym", rounded to the nearest minute.
+    
+    Rounding (rather than truncating) keeps float error from turning e.g.
+    0.7 hours into "0h 41m".
+    """
+    hours, minutes = divmod(int(round(hours_value * 60)), 60)
+    return f"{hours}h {minutes}m"
+
+
+def _response_format(model: str) -> Dict[str, Any]:
+    """
+    Pick the response format for a model: the strict meeting data schema
+    where structured outputs are supported, otherwise plain JSON mode.
+    """
+    if model in STRUCTURED_OUTPUT_MODELS:
+        return {"type": "json_schema", "json_schema": MEETING_DATA_SCHEMA}
+    return {"type": "json_object"}  # Force JSON response
+
+
+def _is_iso_date(value: Any) -> bool:
+    """
+    Check whether a value is already a valid YYYY-MM-DD date string.
+    
+    The prompt asks for this format, so this is the usual case; it lets the
+    caller skip dateutil's much slower format guessing.
+    """
+    if not isinstance(value, str) or len(value) != 10:
+        return False
+    try:
+        date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
 class LLMExtractor:
     """Extracts meeting data from text using LLM models."""
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        fallback_models: Optional[List[str]] = None
+    ):
         """
         Initialize the LLM extractor.
         
         Args:
             api_key: OpenAI API key (falls back to settings if not provided)
             model: Which model to use for extraction (defaults to settings.DEFAULT_LLM_MODEL)
+            fallback_models: Models to try in order when the primary model is
+                rate limited or times out (defaults to settings.LLM_FALLBACK_MODELS)
             
         Raises:
             ValidationError: If API key is missing or invalid
@@ -59,10 +142,25 @@ class LLMExtractor:
             if not self.api_key:
                 raise ValidationError("Valid OpenAI API key is required")
             
-            self.client = OpenAI(api_key=self.api_key)
+            # Native async client: requests run on the event loop instead of
+            # each one holding a threadpool worker
+            self.client = AsyncOpenAI(api_key=self.api_key)
             # Use model from parameters, or from settings, or fall back to gpt-4o-mini
             self.model = model or settings.DEFAULT_LLM_MODEL
-            logger.info(f"LLM Extractor initialized with model: {self.model}")
+            self.fallback_models = [
+                m for m in (settings.LLM_FALLBACK_MODELS if fallback_models is None else fallback_models)
+                if m != self.model
+            ]
+            # Results for exact repeat requests (None when disabled)
+            self.cache = ExtractionCache(settings.LLM_CACHE_SIZE) if settings.LLM_CACHE_SIZE > 0 else None
+            # Keeps calls within the account's OpenAI quota (None when no limits are set)
+            self.rate_limiter = None
+            if settings.LLM_REQUESTS_PER_MINUTE or settings.LLM_TOKENS_PER_MINUTE:
+                self.rate_limiter = TokenBucketLimiter(
+                    requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+                    tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE
+                )
+            logger.info(f"LLM Extractor initialized with model: {self.model} (fallbacks: {self.fallback_models})")
             
         except Exception as e:
             logger.error(f"Failed to initialize LLM extractor: {str(e)}", exc_info=True)
@@ -71,6 +169,10 @@ class LLMExtractor:
                 original_exception=e
             )
     
+    async def close(self) -> None:
+        """Close the OpenAI client and its pooled connections."""
+        await self.client.close()
+    
     def _format_duration(self, hours_value: Union[float, str]) -> str:
         """
         Format a duration value to the standard "Xh Ym" format.
@@ -81,39 +183,83 @@ class LLMExtractor:
         Returns:
             Formatted duration string like "1h 30m"
         """
+        # Numbers (the usual non-string reply) need no parsing
+        if isinstance(hours_value, (int, float)) and not isinstance(hours_value, bool):
+            return _hours_to_duration(hours_value)
+        
         # If it's already in the correct format, return it
-        if isinstance(hours_value, str) and re.match(r'^\d+h\s+\d+m$', hours_value.strip()):
+        if isinstance(hours_value, str) and _DURATION_RE.match(hours_value.strip()):
             return hours_value
             
         try:
             # Convert to float if it's a string representing a number
             if isinstance(hours_value, str):
                 # Try to extract numeric part if it has units
-                match = re.match(r'(\d+\.?\d*)', hours_value)
+                match = _LEADING_NUMBER_RE.match(hours_value)
                 if match:
                     hours_value = float(match.group(1))
                 else:
                     hours_value = float(hours_value)
             
-            # Calculate hours and minutes
-            hours = int(hours_value)
-            minutes = int((hours_value - hours) * 60)
-            
-            # Format as "Xh Ym"
-            return f"{hours}h {minutes}m"
+            return _hours_to_duration(hours_value)
             
         except (ValueError, TypeError) as e:
             logger.warning(f"Failed to format duration '{hours_value}': {str(e)}")
             # Return the original value if we can't format it
             return str(hours_value) if hours_value is not None else None
 
+    async def _create_completion(self, messages: List[Dict[str, str]], extraction_id: str) -> Tuple[Any, str]:
+        """
+        Request a chat completion, falling back to the next model when one
+        is rate limited or times out.
+        
+        The SDK already retries those errors with backoff for each model, so
+        a fallback only happens once the current model's retries are used up.
+        With a rate limiter, each attempt first waits for quota.
+        
+        Args:
+            messages: Chat messages to send
+            extraction_id: ID of the extraction, for logging
+            
+        Returns:
+            Tuple of the chat completion response and the model that produced it
+            
+        Raises:
+            OpenAIError: If the last model fails too, or on any other API error
+        """
+        models = [self.model] + self.fallback_models
+        # Rough token estimate (about 4 characters per token) plus the reply
+        estimated_tokens = sum(len(m["content"]) for m in messages) // 4 + ESTIMATED_RESPONSE_TOKENS
+        
+        for index, model in enumerate(models):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                logger.debug("Sending request to OpenAI API with model %s", model)
+                response = await self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=0.1,  # Low temperature for more consistent extraction
+                    response_format=_response_format(model)
+                )
+                return response, model
+            except (RateLimitError, APITimeoutError) as e:
+                if index == len(models) - 1:
+                    raise
+                logger.warning(
+                    f"Model {model} unavailable ({type(e).__name__}) [{extraction_id}], "
+                    f"falling back to {models[index + 1]}"
+                )
+
     @log_async_function_call(logger)
-    async def extract(self, text: str) -> Dict[str, Any]:
+    async def extract(self, text: str, extraction_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract structured meeting data from text using OpenAI's API.
         
         Args:
             text: The transcribed meeting text
+            extraction_id: ID to log this extraction under (the caller's,
+                so both sides' logs line up); generated if not given
             
         Returns:
             Dictionary containing extracted meeting data
@@ -126,7 +272,7 @@ class LLMExtractor:
         result["notes"] = text  # Always include the original text as notes
         result["extraction_status"] = ExtractionStatus.PENDING.value
         
-        extraction_id = f"extract_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        extraction_id = extraction_id or f"llm_extract_{next(_EXTRACTION_IDS)}"
         logger.info(
             format_structured_log(
                 f"Starting LLM extraction [{extraction_id}]",
@@ -137,36 +283,67 @@ class LLMExtractor:
         try:
             result["extraction_status"] = ExtractionStatus.PROCESSING.value
             
-            # Get the system prompt for meeting data extraction
-            system_prompt = EXTRACTION_PROMPTS["meeting_data"]
+            date_context = build_date_context(datetime.now().date())
+            
+            # The full text is still kept as the notes
+            llm_text = _trim_for_llm(text)
+            if llm_text is not text:
+                logger.info(
+                    format_structured_log(
+                        f"Transcription trimmed for LLM extraction [{extraction_id}]",
+                        {"text_length": len(text), "sent_length": len(llm_text)}
+                    )
+                )
+            
+            # Reuse the result of an identical earlier request
+            cache_key = None
+            if self.cache is not None:
+                cache_key = ExtractionCache.make_key(self.model, _SYSTEM_MESSAGE["content"], date_context, llm_text)
+                cached_data = self.cache.get(cache_key)
+                if cached_data is not None:
+                    result.update(cached_data)
+                    result["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    result["extraction_status"] = ExtractionStatus.COMPLETE.value
+                    logger.info(
+                        format_structured_log(
+                            f"LLM extraction served from cache [{extraction_id}]",
+                            {
+                                "customer": result.get("customer_name"),
+                                "date": result.get("meeting_date"),
+                                "total_hours": result.get("total_hours")
+                            }
+                        )
+                    )
+                    return result
             
             # Make the API call
-            logger.debug(f"Sending request to OpenAI API with model {self.model}")
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text}
+            response, answered_by = await self._create_completion(
+                [
+                    # Static prompt first so it stays a cacheable prefix
+                    _SYSTEM_MESSAGE,
+                    {"role": "system", "content": date_context},
+                    {"role": "user", "content": llm_text}
                 ],
-                temperature=0.1,  # Low temperature for more consistent extraction
-                response_format={"type": "json_object"}  # Force JSON response
+                extraction_id
             )
             
             result_text = response.choices[0].message.content
-            logger.debug(f"Received LLM response: {result_text[:200]}...")
+            # Lazy %-formatting: the message is only built when DEBUG is enabled
+            logger.debug("Received LLM response: %.200s...", result_text)
             
             # Parse the JSON response
             try:
-                extracted_data = json.loads(result_text)
+                extracted_data = orjson.loads(result_text)
                 
                 # Update our result with the extracted data
-                for key in DEFAULT_MEETING_DATA.keys():
-                    if key in extracted_data and extracted_data[key] is not None:
-                        result[key] = extracted_data[key]
+                # (a single dict update rather than a lookup per schema key)
+                result.update({
+                    key: value for key, value in extracted_data.items()
+                    if key in DEFAULT_MEETING_DATA and value is not None
+                })
                 
                 # Process dates - convert to YYYY-MM-DD format
-                if result.get("meeting_date"):
+                if result.get("meeting_date") and not _is_iso_date(result["meeting_date"]):
                     try:
                         date_str = result["meeting_date"]
                         parsed_date = parser.parse(date_str)
@@ -184,6 +361,13 @@ class LLMExtractor:
                 
                 result["extraction_status"] = ExtractionStatus.COMPLETE.value
                 
+                # Only successful extractions by the primary model are cached
+                # (the key names the primary model); failures raise above
+                if cache_key is not None and answered_by == self.model:
+                    self.cache.set(cache_key, {
+                        key: result[key] for key in DEFAULT_MEETING_DATA if key != "timestamp"
+                    })
+                
                 # Log success
                 logger.info(
                     format_structured_log(
@@ -199,7 +383,7 @@ class LLMExtractor:
                 
                 return result
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 result["extraction_status"] = ExtractionStatus.FAILED.value
                 
                 logger.error(
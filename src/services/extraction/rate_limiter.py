@@ -0,0 +1,80 @@
+"""
+Rate limiting for OpenAI API calls.
+Keeps extraction traffic within the account's requests-per-minute and
+tokens-per-minute quotas instead of running into HTTP 429s.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket limiter with a request budget and a token budget per minute.
+    
+    Both buckets start full and refill continuously. A limit of 0 disables
+    that bucket. All access happens on the event loop, and acquire() has no
+    await between checking and taking capacity, so no locking is needed.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_minute: Maximum requests per minute (0 for no limit)
+            tokens_per_minute: Maximum tokens per minute (0 for no limit)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_capacity = float(requests_per_minute)
+        self._token_capacity = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+    
+    def _refill(self) -> None:
+        """Add the capacity earned since the last refill, up to each bucket's size."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        
+        if self.requests_per_minute:
+            self._request_capacity = min(
+                float(self.requests_per_minute),
+                self._request_capacity + elapsed * self.requests_per_minute / 60
+            )
+        if self.tokens_per_minute:
+            self._token_capacity = min(
+                float(self.tokens_per_minute),
+                self._token_capacity + elapsed * self.tokens_per_minute / 60
+            )
+    
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until there is capacity for one request using the given tokens.
+        
+        Args:
+            tokens: Estimated tokens the request will use (a request larger
+                than the whole token budget waits for a full bucket)
+        """
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+        
+        while True:
+            self._refill()
+            
+            request_deficit = 1 - self._request_capacity if self.requests_per_minute else 0
+            token_deficit = tokens - self._token_capacity if self.tokens_per_minute else 0
+            
+            if request_deficit <= 0 and token_deficit <= 0:
+                if self.requests_per_minute:
+                    self._request_capacity -= 1
+                if self.tokens_per_minute:
+                    self._token_capacity -= tokens
+                return
+            
+            # Sleep until the bucket that's furthest behind has refilled enough
+            wait_seconds = max(
+                request_deficit * 60 / self.requests_per_minute if request_deficit > 0 else 0,
+                token_deficit * 60 / self.tokens_per_minute if token_deficit > 0 else 0
+            )
+            await asyncio.sleep(wait_seconds)
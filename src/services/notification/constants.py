@@ -1,3 +1,12 @@
 # Email parameters
 DEFAULT_EMAIL_SUBJECT = "[TimeLogger] New Meeting Recorded"
-MAX_RETRY_ATTEMPTS = 3
\ No newline at end of file
+MAX_RETRY_ATTEMPTS = 3
+
+# Timeout for each SMTP socket operation, in seconds, so a session silently
+# dropped while idle fails the send instead of blocking it
+SMTP_TIMEOUT = 30
+
+# Backoff between send attempts, in seconds
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 8.0
+RETRY_JITTER = 0.5
\ No newline at end of file
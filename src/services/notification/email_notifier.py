@@ -3,8 +3,11 @@ Email notification service for meeting recordings.
 """
 
 import smtplib
+import threading
+import random
 import os
 from email.mime.text import MIMEText
+from html import escape
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Any, List, Optional
 import asyncio
@@ -15,7 +18,14 @@ from config.config import get_settings
 from src.utils import get_logger, format_structured_log
 from src.utils.exceptions import BaseAppException, ErrorCode
 from src.enums.notification import NotificationStatus, NotificationChannel
-from src.services.notification.constants import DEFAULT_EMAIL_SUBJECT, MAX_RETRY_ATTEMPTS
+from src.services.notification.constants import (
+    DEFAULT_EMAIL_SUBJECT,
+    MAX_RETRY_ATTEMPTS,
+    SMTP_TIMEOUT,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_JITTER
+)
 from src.services.notification.templates import get_template
 
 
@@ -71,10 +81,16 @@ class EmailNotifier:
         # Parse recipient emails
         if recipient_emails:
             self.recipient_emails = [e.strip() for e in recipient_emails.split(',')]
-        elif settings.RECIPIENT_EMAILS:
-            self.recipient_emails = [e.strip() for e in settings.RECIPIENT_EMAILS.split(',')]
         else:
-            self.recipient_emails = []
+            self.recipient_emails = settings.recipient_emails_list
+        # The To header is the same for every message
+        self._recipients_header = ", ".join(self.recipient_emails)
+        
+        # SMTP session kept open between notifications, so each send doesn't
+        # repeat the TCP connect, STARTTLS and login. Sends run in worker
+        # threads, so access is serialized with a thread lock.
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
         
         logger.info(
             format_structured_log(
@@ -98,11 +114,12 @@ class EmailNotifier:
         Returns:
             Status dictionary with information about the notification
         """
-        notification_id = f"email_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        notification_id = f"email_{now.strftime('%Y%m%d%H%M%S%f')}"
         
         result = {
             "notification_id": notification_id,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "notification_type": NotificationChannel.EMAIL.value,
             "status": NotificationStatus.PENDING.value
         }
@@ -157,10 +174,10 @@ class EmailNotifier:
                 
             except Exception as e:
                 retry_count += 1
-                if retry_count >= MAX_RETRY_ATTEMPTS:
+                if retry_count >= MAX_RETRY_ATTEMPTS or self._is_permanent_failure(e):
                     logger.error(
                         format_structured_log(
-                            f"Failed to send email notification after {MAX_RETRY_ATTEMPTS} attempts [{notification_id}]",
+                            f"Failed to send email notification after {retry_count} attempts [{notification_id}]",
                             {"error": str(e)}
                         ),
                         exc_info=True
@@ -170,13 +187,37 @@ class EmailNotifier:
                     result["error"] = str(e)
                     return result
                 else:
+                    # Exponential backoff with jitter before retrying
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** (retry_count - 1)))
+                    delay += random.uniform(0, RETRY_JITTER)
                     logger.warning(
-                        f"Email send attempt {retry_count} failed, retrying: {str(e)}"
+                        f"Email send attempt {retry_count} failed, retrying in {delay:.1f}s: {str(e)}"
                     )
-                    await asyncio.sleep(1)  # Wait before retrying
+                    await asyncio.sleep(delay)
         
         return result
     
+    @staticmethod
+    def _is_permanent_failure(error: Exception) -> bool:
+        """
+        Check whether a send error won't go away by retrying.
+        
+        Authentication failures and 5xx SMTP replies are permanent; 4xx
+        replies and connection errors are treated as transient.
+        
+        Args:
+            error: Exception raised by a send attempt
+            
+        Returns:
+            True if the send should not be retried
+        """
+        cause = getattr(error, "original_exception", None) or error
+        if isinstance(cause, smtplib.SMTPAuthenticationError):
+            return True
+        if isinstance(cause, smtplib.SMTPResponseException):
+            return cause.smtp_code >= 500
+        return False
+    
     def _create_email_message(self, subject: str, meeting_data: Dict[str, Any]) -> MIMEMultipart:
         """
         Create an email message with meeting data.
@@ -192,14 +233,15 @@ class EmailNotifier:
             # Get the template using the centralized template system
             template = get_template("meeting_notification")
             
-            # Prepare data with defaults for missing values
+            # Prepare data with defaults for missing values, HTML-escaped since
+            # it comes from the transcription
             formatted_data = {
-                "customer_name": meeting_data.get('customer_name', 'Not provided'),
-                "meeting_date": meeting_data.get('meeting_date', 'Not provided'),
-                "start_time": meeting_data.get('start_time', 'Not provided'),
-                "end_time": meeting_data.get('end_time', 'Not provided'),
-                "total_hours": meeting_data.get('total_hours', 'Not provided'),
-                "notes": meeting_data.get('notes', 'No notes provided')
+                "customer_name": escape(str(meeting_data.get('customer_name', 'Not provided'))),
+                "meeting_date": escape(str(meeting_data.get('meeting_date', 'Not provided'))),
+                "start_time": escape(str(meeting_data.get('start_time', 'Not provided'))),
+                "end_time": escape(str(meeting_data.get('end_time', 'Not provided'))),
+                "total_hours": escape(str(meeting_data.get('total_hours', 'Not provided'))),
+                "notes": escape(str(meeting_data.get('notes', 'No notes provided')))
             }
             
             # Format the template with the data
@@ -211,9 +253,9 @@ class EmailNotifier:
             body = f"""
             <html><body>
                 <h2>Meeting Data</h2>
-                <p>Customer: {meeting_data.get('customer_name', 'Not provided')}</p>
-                <p>Date: {meeting_data.get('meeting_date', 'Not provided')}</p>
-                <p>Hours: {meeting_data.get('total_hours', 'Not provided')}</p>
+                <p>Customer: {escape(str(meeting_data.get('customer_name', 'Not provided')))}</p>
+                <p>Date: {escape(str(meeting_data.get('meeting_date', 'Not provided')))}</p>
+                <p>Hours: {escape(str(meeting_data.get('total_hours', 'Not provided')))}</p>
             </body></html>
             """
         
@@ -221,7 +263,7 @@ class EmailNotifier:
         message = MIMEMultipart("alternative")
         message["Subject"] = subject
         message["From"] = self.sender_email
-        message["To"] = ", ".join(self.recipient_emails)
+        message["To"] = self._recipients_header
         
         # Attach HTML content
         html_part = MIMEText(body, "html")
@@ -229,9 +271,50 @@ class EmailNotifier:
         
         return message
     
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        Get the open SMTP session, connecting and logging in if there isn't
+        one or the server has dropped it.
+        Must be called with the SMTP lock held.
+        
+        Returns:
+            Logged-in SMTP connection
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_server()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        return server
+    
+    def _close_server(self) -> None:
+        """
+        Close the cached SMTP session, if any.
+        Must be called with the SMTP lock held.
+        """
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
     def _send_email(self, message: MIMEMultipart) -> None:
         """
-        Send an email using SMTP.
+        Send an email over the shared SMTP session.
         This is a blocking operation that should be run in a thread.
         
         Args:
@@ -240,14 +323,22 @@ class EmailNotifier:
         Raises:
             EmailSendError: If sending the email fails
         """
-        try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(message)
-        except Exception as e:
-            raise EmailSendError(
-                f"Failed to send email: {str(e)}",
-                details={"smtp_server": self.smtp_server, "smtp_port": self.smtp_port},
-                original_exception=e
-            )
\ No newline at end of file
+        with self._smtp_lock:
+            try:
+                self._get_server().send_message(message)
+            except Exception as e:
+                # Start the next attempt from a fresh connection
+                self._close_server()
+                raise EmailSendError(
+                    f"Failed to send email: {str(e)}",
+                    details={"smtp_server": self.smtp_server, "smtp_port": self.smtp_port},
+                    original_exception=e
+                )
+    
+    async def close(self) -> None:
+        """Close the SMTP session kept open between notifications."""
+        def close_locked():
+            with self._smtp_lock:
+                self._close_server()
+        
+        await asyncio.to_thread(close_locked)
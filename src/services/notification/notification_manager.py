@@ -2,13 +2,18 @@
 Notification manager for sending alerts about new meetings.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
+import asyncio
 import uuid
 from datetime import datetime
 
 from config.config import get_settings
 from src.utils import get_logger, log_async_function_call, format_structured_log
 from src.enums.notification import NotificationStatus, NotificationChannel
+from src.services.notification.email_notifier import EmailNotifier
+
+if TYPE_CHECKING:
+    from src.services.notification.slack_notifier import SlackNotifier
 
 
 logger = get_logger(__name__)
@@ -31,9 +36,14 @@ class NotificationManager:
         self.email_enabled = settings.ENABLE_EMAIL_NOTIFICATIONS
         self.slack_enabled = settings.ENABLE_SLACK_NOTIFICATIONS
         
-        # Lazy-load notification implementations when needed
-        self._email_notifier = None
-        self._slack_notifier = None
+        # Notifiers for the enabled channels
+        self._email_notifier: Optional[EmailNotifier] = EmailNotifier() if self.email_enabled else None
+        self._slack_notifier: Optional["SlackNotifier"] = None
+        if self.slack_enabled:
+            # Imported only when enabled: it needs aiohttp, which isn't a
+            # required dependency
+            from src.services.notification.slack_notifier import SlackNotifier
+            self._slack_notifier = SlackNotifier()
         
         logger.info(
             format_structured_log(
@@ -57,45 +67,53 @@ class NotificationManager:
         Returns:
             Status dictionary with information about all notifications
         """
-        notification_id = f"notify_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        notification_id = f"notify_{now.strftime('%Y%m%d%H%M%S%f')}"
         
         result = {
             "notification_id": notification_id,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "channels": [],
             "overall_status": NotificationStatus.SKIPPED.value
         }
         
-        # Collect results from all notification attempts
-        notifications_sent = False
-        notification_results = []
+        # Send on all enabled channels at once; they don't depend on each other
+        channel_sends = []
+        if self._email_notifier:
+            channel_sends.append(
+                (NotificationChannel.EMAIL, self._email_notifier.send_meeting_notification(meeting_data))
+            )
+        if self._slack_notifier:
+            channel_sends.append(
+                (NotificationChannel.SLACK, self._slack_notifier.send_meeting_notification(meeting_data))
+            )
         
-        # Send email notification if enabled
-        if self.email_enabled:
-            email_result = await self._send_email_notification(meeting_data)
-            notification_results.append(email_result)
-            if email_result.get("status") == NotificationStatus.SENT.value:
-                notifications_sent = True
-            
-            # Add channel info to result
-            result["channels"].append({
-                "type": NotificationChannel.EMAIL.value,
-                "status": email_result.get("status"),
-                "details": email_result
-            })
+        channel_results = await asyncio.gather(
+            *(send for _, send in channel_sends),
+            return_exceptions=True
+        )
         
-        # Send Slack notification if enabled
-        if self.slack_enabled:
-            slack_result = await self._send_slack_notification(meeting_data)
-            notification_results.append(slack_result)
-            if slack_result.get("status") == NotificationStatus.SENT.value:
+        notifications_sent = False
+        for (channel, _), channel_result in zip(channel_sends, channel_results):
+            if isinstance(channel_result, Exception):
+                logger.error(
+                    f"{channel.value} notification failed [{notification_id}]: {str(channel_result)}",
+                    exc_info=channel_result
+                )
+                channel_result = {
+                    "notification_type": channel.value,
+                    "status": NotificationStatus.FAILED.value,
+                    "error": str(channel_result)
+                }
+            
+            if channel_result.get("status") == NotificationStatus.SENT.value:
                 notifications_sent = True
             
             # Add channel info to result
             result["channels"].append({
-                "type": NotificationChannel.SLACK.value,
-                "status": slack_result.get("status"),
-                "details": slack_result
+                "type": channel.value,
+                "status": channel_result.get("status"),
+                "details": channel_result
             })
         
         # Determine overall status
@@ -109,36 +127,7 @@ class NotificationManager:
         
         return result
     
-    async def _send_email_notification(self, meeting_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Send an email notification.
-        
-        Args:
-            meeting_data: Meeting data to include in the notification
-            
-        Returns:
-            Status dictionary
-        """
-        # Lazy-load the email notifier
-        if not self._email_notifier:
-            from src.services.notification.email_notifier import EmailNotifier
-            self._email_notifier = EmailNotifier()
-        
-        return await self._email_notifier.send_meeting_notification(meeting_data)
-    
-    async def _send_slack_notification(self, meeting_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Send a Slack notification.
-        
-        Args:
-            meeting_data: Meeting data to include in the notification
-            
-        Returns:
-            Status dictionary
-        """
-        # Lazy-load the slack notifier
-        if not self._slack_notifier:
-            from src.services.notification.slack_notifier import SlackNotifier
-            self._slack_notifier = SlackNotifier()
-        
-        return await self._slack_notifier.send_meeting_notification(meeting_data)
\ No newline at end of file
+    async def close(self) -> None:
+        """Close connections held open by the notifiers (the SMTP session)."""
+        if self._email_notifier:
+            await self._email_notifier.close()
@@ -69,11 +69,12 @@ class SlackNotifier:
         Returns:
             Status dictionary with information about the notification
         """
-        notification_id = f"slack_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        notification_id = f"slack_{now.strftime('%Y%m%d%H%M%S%f')}"
         
         result = {
             "notification_id": notification_id,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "notification_type": "slack",
             "status": "pending"
         }
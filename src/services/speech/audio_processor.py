@@ -7,7 +7,7 @@ import os
 import uuid
 import shutil
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union, BinaryIO
 import logging
 from pathlib import Path
 
@@ -26,6 +26,9 @@ from src.enums import ProcessingStatus, ErrorCode
 
 logger = get_logger(__name__)
 
+# Chunk size for copying uploaded audio to disk
+COPY_CHUNK_SIZE = 1024 * 1024
+
 class AudioProcessor:
     """
     Handles audio file processing, validation, and storage.
@@ -90,12 +93,13 @@ class AudioProcessor:
         logger.debug(f"Audio file validated successfully: {file_path}")
         return True, None
     
-    def save_audio_file(self, audio_data: bytes, filename: Optional[str] = None) -> str:
+    def save_audio_file(self, audio_data: Union[bytes, BinaryIO], filename: Optional[str] = None) -> str:
         """
         Save audio data to a file in the storage directory.
         
         Args:
-            audio_data: Raw audio data in bytes
+            audio_data: Raw audio data in bytes, or a binary file object to
+                copy from its current position in chunks
             filename: Optional filename (if None, generates a unique name)
             
         Returns:
@@ -111,12 +115,16 @@ class AudioProcessor:
         # Save the file
         try:
             with open(file_path, "wb") as f:
-                f.write(audio_data)
+                if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                    f.write(audio_data)
+                else:
+                    shutil.copyfileobj(audio_data, f, COPY_CHUNK_SIZE)
+                size_bytes = f.tell()
             
             logger.info(
                 format_structured_log(
                     f"Audio file saved", 
-                    {"file_path": file_path, "size_bytes": len(audio_data)}
+                    {"file_path": file_path, "size_bytes": size_bytes}
                 )
             )
             return file_path
@@ -5,7 +5,8 @@ Main entry point for speech-to-text functionality.
 
 import os
 import uuid
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, Union, BinaryIO
 from datetime import datetime
 
 from config.config import get_settings
@@ -88,12 +89,13 @@ class SpeechManager:
             )
     
     @log_async_function_call(logger)
-    async def transcribe_audio_data(self, audio_data: bytes) -> Dict[str, Any]:
+    async def transcribe_audio_data(self, audio_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """
-        Transcribe audio data (bytes).
+        Transcribe audio data (bytes or a binary file object).
         
         Args:
-            audio_data: Raw audio data in bytes
+            audio_data: Raw audio data in bytes, or a binary file object
+                (e.g. an upload's spooled file) that is streamed to disk
             
         Returns:
             Dictionary with transcription results
@@ -113,15 +115,15 @@ class SpeechManager:
         logger.info(
             format_structured_log(
                 f"Starting audio transcription [{processing_id}]",
-                {"size_bytes": len(audio_data), "instance_id": self.instance_id}
+                {"instance_id": self.instance_id}
             )
         )
         
         try:
             result["processing_status"] = ProcessingStatus.PROCESSING.value
             
-            # Save the audio data to a file
-            file_path = self.audio_processor.save_audio_file(audio_data)
+            # Save the audio data to a file (blocking disk IO, so in a thread)
+            file_path = await asyncio.to_thread(self.audio_processor.save_audio_file, audio_data)
             result["file_path"] = file_path
             
             # Transcribe the audio file
@@ -167,6 +169,21 @@ class SpeechManager:
         
         return result
     
+    async def save_audio_data(self, audio_data: Union[bytes, BinaryIO]) -> str:
+        """
+        Save audio data to the storage directory without transcribing it.
+        
+        Args:
+            audio_data: Raw audio data in bytes, or a binary file object
+            
+        Returns:
+            Path to the saved audio file
+            
+        Raises:
+            TranscriptionError: If the file can't be saved
+        """
+        return await asyncio.to_thread(self.audio_processor.save_audio_file, audio_data)
+    
     @log_async_function_call(logger)
     async def transcribe_audio_file(self, file_path: str, copy_to_storage: bool = True) -> Dict[str, Any]:
         """
@@ -4,6 +4,7 @@ Google Sheets implementation for storing meeting data.
 
 import os
 import asyncio
+import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
@@ -71,6 +72,11 @@ class GoogleSheetsStorage:
             
             self.service = self._create_sheets_service()
             
+            # The service's httplib2 transport isn't thread-safe, and the
+            # instance is shared between requests, so API calls made from
+            # worker threads are serialized
+            self._service_lock = threading.Lock()
+            
             logger.info(
                 format_structured_log(
                     "GoogleSheetsStorage initialized",
@@ -121,6 +127,11 @@ class GoogleSheetsStorage:
                 original_exception=e
             )
     
+    def _call_locked(self, func, *args):
+        """Run a blocking Sheets API call while holding the service lock."""
+        with self._service_lock:
+            return func(*args)
+    
     async def initialize_sheet(self) -> bool:
         """
         Initialize the sheet with headers if it doesn't exist.
@@ -133,7 +144,7 @@ class GoogleSheetsStorage:
         """
         # asyncio to run blocking IO in a thread
         try:
-            return await asyncio.to_thread(self._initialize_sheet_sync)
+            return await asyncio.to_thread(self._call_locked, self._initialize_sheet_sync)
         except Exception as e:
             logger.error(f"Error initializing sheet: {str(e)}", exc_info=True)
             raise StorageError(
@@ -335,6 +346,7 @@ class GoogleSheetsStorage:
             
             # asyncio to run blocking IO in a thread
             await asyncio.to_thread(
+                self._call_locked,
                 self._append_row,
                 row_data
             )
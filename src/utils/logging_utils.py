@@ -7,10 +7,10 @@ import logging
 import sys
 import os
 from typing import Optional, Dict, Any
-import uuid
+from secrets import token_hex
 from functools import wraps
 import traceback
-import json
+import orjson
 
 from src.enums import LogLevel
 
@@ -118,7 +118,7 @@ def configure_logging(
 
 def generate_request_id() -> str:
     """Generate a unique request ID for tracking operations in logs."""
-    return str(uuid.uuid4())
+    return token_hex(16)
 
 
 def log_function_call(logger):
@@ -137,11 +137,11 @@ def log_function_call(logger):
             func_name = func.__name__
             try:
                 # Log entry
-                logger.debug(f"Entering {func_name}")
+                logger.debug("Entering %s", func_name)
                 # Call the function
                 result = func(*args, **kwargs)
                 # Log exit
-                logger.debug(f"Exiting {func_name}")
+                logger.debug("Exiting %s", func_name)
                 return result
             except Exception as e:
                 # Log exception with traceback
@@ -171,11 +171,11 @@ def log_async_function_call(logger):
             func_name = func.__name__
             try:
                 # Log entry
-                logger.debug(f"Entering {func_name}")
+                logger.debug("Entering %s", func_name)
                 # Call the function
                 result = await func(*args, **kwargs)
                 # Log exit
-                logger.debug(f"Exiting {func_name}")
+                logger.debug("Exiting %s", func_name)
                 return result
             except Exception as e:
                 # Log exception with traceback
@@ -201,7 +201,7 @@ def format_structured_log(message: str, data: Dict[str, Any]) -> str:
         Formatted log message with JSON data
     """
     try:
-        json_data = json.dumps(data)
+        json_data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
         return f"{message} | {json_data}"
     except Exception:
         return f"{message} | {data!r}"
\ No newline at end of file
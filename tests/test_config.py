@@ -0,0 +1,68 @@
+"""
+Tests for parsing Settings from environment variables.
+"""
+import pytest
+
+from config.config import Settings, SettingsValidationError
+
+
+def test_defaults_when_environment_is_empty():
+    """Unset variables keep their defaults."""
+    settings = Settings.from_env({})
+    
+    assert settings.DEBUG is False
+    assert settings.API_PORT == 8000
+    assert settings.CORS_ORIGINS == ("*",)
+    assert settings.LLM_FALLBACK_MODELS == ()
+    assert settings.OPENAI_API_KEY is None
+
+
+@pytest.mark.parametrize("raw_value, expected", [
+    ("true", True), ("1", True), ("Yes", True), (" on ", True),
+    ("false", False), ("0", False), ("No", False), ("off", False),
+])
+def test_bool_parsing(raw_value, expected):
+    """Booleans accept the same spellings pydantic did."""
+    assert Settings.from_env({"DEBUG": raw_value}).DEBUG is expected
+
+
+def test_int_and_str_parsing():
+    """Integers are converted; strings are kept as given."""
+    settings = Settings.from_env({"API_PORT": "9000", "DEFAULT_LLM_MODEL": "gpt-4o"})
+    
+    assert settings.API_PORT == 9000
+    assert settings.DEFAULT_LLM_MODEL == "gpt-4o"
+
+
+@pytest.mark.parametrize("raw_value, expected", [
+    ("gpt-4o, gpt-3.5-turbo", ("gpt-4o", "gpt-3.5-turbo")),
+    ('["gpt-4o", "gpt-3.5-turbo"]', ("gpt-4o", "gpt-3.5-turbo")),
+    ("gpt-4o,,", ("gpt-4o",)),
+    ("", ()),
+])
+def test_list_parsing(raw_value, expected):
+    """Lists accept a JSON array or a comma-separated string and are stored as tuples."""
+    assert Settings.from_env({"LLM_FALLBACK_MODELS": raw_value}).LLM_FALLBACK_MODELS == expected
+
+
+def test_settings_are_hashable():
+    """Equal settings hash equally, so they can be used as cache keys."""
+    environ = {"CORS_ORIGINS": "http://a.com", "LLM_FALLBACK_MODELS": "gpt-4o"}
+    
+    assert hash(Settings.from_env(environ)) == hash(Settings.from_env(dict(environ)))
+    assert Settings.from_env(environ) != Settings.from_env({})
+
+
+def test_invalid_values_are_all_reported():
+    """Every unparsable value is reported in one SettingsValidationError."""
+    with pytest.raises(SettingsValidationError) as exc_info:
+        Settings.from_env({
+            "DEBUG": "maybe",
+            "API_PORT": "eighty",
+            "CORS_ORIGINS": '["http://a.com"',
+            "APP_NAME": "fine"
+        })
+    
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("DEBUG",), ("API_PORT",), ("CORS_ORIGINS",)
+    ]
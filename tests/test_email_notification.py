@@ -1,15 +1,15 @@
 import asyncio
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from config.config import load_environment
 from src.services.notification import NotificationManager
 from src.utils import configure_logging, get_logger
 
-load_dotenv()
+load_environment()
 configure_logging(level="INFO")
 logger = get_logger(__name__)
 
@@ -0,0 +1,100 @@
+"""
+Tests for resuming ExtractionManager.extract_batch from a checkpoint file.
+Runs offline: the per-text extraction is replaced with a fake.
+"""
+import asyncio
+import json
+
+import pytest
+
+from src.enums import ExtractionStatus
+from src.services.extraction.extraction_manager import (
+    ExtractionManager,
+    _append_checkpoint,
+    _checkpoint_key
+)
+
+
+TEXTS = ["meeting one", "meeting two", "meeting three", "meeting four"]
+
+
+@pytest.fixture
+def manager():
+    """ExtractionManager whose extract() records each text instead of calling the API."""
+    extraction_manager = ExtractionManager(openai_api_key="test-key", model="gpt-4o-mini")
+    extraction_manager.extracted = []
+    
+    async def fake_extract(text):
+        extraction_manager.extracted.append(text)
+        return {"notes": text, "extraction_status": ExtractionStatus.COMPLETE.value}
+    
+    extraction_manager.extract = fake_extract
+    return extraction_manager
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    """Checkpoint left by an interrupted run: two results and a half-written line."""
+    path = tmp_path / "checkpoint.jsonl"
+    for text in (TEXTS[0], TEXTS[2]):
+        _append_checkpoint(str(path), _checkpoint_key("gpt-4o-mini", text), {
+            "notes": text,
+            "extraction_status": ExtractionStatus.COMPLETE.value,
+            "from_checkpoint": True
+        })
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"input_hash": "%s", "result": {"notes"' % _checkpoint_key("gpt-4o-mini", TEXTS[1]))
+    return path
+
+
+def read_checkpoint(path):
+    """Parse the complete lines of a checkpoint file."""
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue
+    return rows
+
+
+def test_resume_extracts_only_missing_texts(manager, checkpoint_path):
+    """Texts saved in the checkpoint are reused; the rest are extracted and appended."""
+    results = asyncio.run(manager.extract_batch(TEXTS, checkpoint_path=str(checkpoint_path)))
+    
+    assert sorted(manager.extracted) == sorted([TEXTS[1], TEXTS[3]])
+    assert [result["notes"] for result in results] == TEXTS
+    assert [result.get("from_checkpoint", False) for result in results] == [True, False, True, False]
+    
+    # A second run finds everything in the checkpoint
+    manager.extracted.clear()
+    rerun_results = asyncio.run(manager.extract_batch(TEXTS, checkpoint_path=str(checkpoint_path)))
+    
+    assert manager.extracted == []
+    assert [result["notes"] for result in rerun_results] == TEXTS
+    assert len(read_checkpoint(checkpoint_path)) == len(TEXTS)
+
+
+def test_model_change_ignores_old_results(manager, checkpoint_path):
+    """Results saved for another model are not reused."""
+    manager.model = "gpt-4o"
+    
+    asyncio.run(manager.extract_batch(TEXTS, checkpoint_path=str(checkpoint_path)))
+    
+    assert sorted(manager.extracted) == sorted(TEXTS)
+
+
+def test_failed_extractions_are_not_checkpointed(manager, tmp_path):
+    """A failed extraction is retried on the next run instead of being saved."""
+    path = tmp_path / "checkpoint.jsonl"
+    
+    async def failing_extract(text):
+        manager.extracted.append(text)
+        return {"notes": text, "extraction_status": ExtractionStatus.FAILED.value}
+    
+    manager.extract = failing_extract
+    results = asyncio.run(manager.extract_batch(TEXTS[:2], checkpoint_path=str(path)))
+    
+    assert [result["extraction_status"] for result in results] == [ExtractionStatus.FAILED.value] * 2
+    assert not path.exists()
@@ -0,0 +1,49 @@
+"""
+Tests for the ExtractionCache LRU cache of LLM extraction results.
+"""
+from src.services.extraction.cache import ExtractionCache
+
+
+def make_key(model="gpt-4o-mini", system_prompt="prompt", date_context="Today is 2025-01-01", text="text"):
+    return ExtractionCache.make_key(model, system_prompt, date_context, text)
+
+
+def test_key_depends_on_every_request_part():
+    """Changing the model, prompt, date context or text gives a different key."""
+    base_key = make_key()
+    
+    assert make_key() == base_key
+    assert make_key(model="gpt-4o") != base_key
+    assert make_key(system_prompt="other prompt") != base_key
+    assert make_key(date_context="Today is 2025-01-02") != base_key
+    assert make_key(text="other text") != base_key
+
+
+def test_get_returns_copy_of_stored_result():
+    """Callers can modify results without changing the cached entry."""
+    cache = ExtractionCache()
+    key = make_key()
+    cache.set(key, {"customer_name": "Acme"})
+    
+    result = cache.get(key)
+    result["customer_name"] = "Changed"
+    
+    assert cache.get(key) == {"customer_name": "Acme"}
+    assert cache.get(make_key(text="missing")) is None
+
+
+def test_evicts_least_recently_used_entry():
+    """When full, the entry that was used least recently is dropped first."""
+    cache = ExtractionCache(maxsize=2)
+    key_a, key_b, key_c = make_key(text="a"), make_key(text="b"), make_key(text="c")
+    cache.set(key_a, {"customer_name": "A"})
+    cache.set(key_b, {"customer_name": "B"})
+    
+    # Reading A makes B the least recently used entry
+    cache.get(key_a)
+    cache.set(key_c, {"customer_name": "C"})
+    
+    assert len(cache) == 2
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) == {"customer_name": "A"}
+    assert cache.get(key_c) == {"customer_name": "C"}
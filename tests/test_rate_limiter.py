@@ -0,0 +1,86 @@
+"""
+Tests for the TokenBucketLimiter used to pace OpenAI extraction calls.
+Runs offline: the limiter's clock and sleep are replaced with a fake clock.
+"""
+import asyncio
+
+import pytest
+
+from src.services.extraction import rate_limiter
+from src.services.extraction.rate_limiter import TokenBucketLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep; sleeping advances the clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_clock.sleep)
+    return fake_clock
+
+
+def test_acquire_within_capacity_does_not_wait(clock):
+    """Requests that fit in the full buckets go through immediately."""
+    limiter = TokenBucketLimiter(requests_per_minute=3, tokens_per_minute=300)
+    
+    for _ in range(3):
+        asyncio.run(limiter.acquire(100))
+    
+    assert clock.sleeps == []
+
+
+def test_request_limit_waits_for_refill(clock):
+    """Once the request bucket is empty, the next request waits for one request's refill."""
+    limiter = TokenBucketLimiter(requests_per_minute=60)
+    
+    for _ in range(60):
+        asyncio.run(limiter.acquire(1))
+    asyncio.run(limiter.acquire(1))
+    
+    # 60 requests per minute refill one request per second
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_token_limit_waits_for_missing_tokens(clock):
+    """A request needing more tokens than are left waits for just the shortfall."""
+    limiter = TokenBucketLimiter(tokens_per_minute=600)
+    
+    asyncio.run(limiter.acquire(500))
+    asyncio.run(limiter.acquire(200))
+    
+    # 100 tokens are left, so 100 more are needed at 10 tokens per second
+    assert clock.sleeps == [pytest.approx(10.0)]
+
+
+def test_oversized_request_waits_for_full_bucket(clock):
+    """A request larger than the whole token budget is capped at the bucket size."""
+    limiter = TokenBucketLimiter(tokens_per_minute=600)
+    
+    asyncio.run(limiter.acquire(100))
+    asyncio.run(limiter.acquire(10_000))
+    
+    assert clock.sleeps == [pytest.approx(10.0)]
+
+
+def test_disabled_limits_never_wait(clock):
+    """Limits of 0 disable the limiter."""
+    limiter = TokenBucketLimiter()
+    
+    for _ in range(1000):
+        asyncio.run(limiter.acquire(10_000))
+    
+    assert clock.sleeps == []
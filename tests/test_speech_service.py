@@ -7,21 +7,35 @@ import os
 import sys
 import asyncio
 import argparse
-from dotenv import load_dotenv
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from config.config import load_environment
 from src.utils import configure_logging, get_logger
 from src.services.speech import SpeechManager
 
 
-load_dotenv()
+load_environment()
 
 configure_logging(level="INFO")
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=None)
+def _speech_manager(api_key: str) -> SpeechManager:
+    """Build the SpeechManager once and reuse it across files."""
+    return SpeechManager(openai_api_key=api_key)
+
+@lru_cache(maxsize=None)
+def _extraction_manager(api_key: str):
+    """Build the ExtractionManager once and reuse it across files."""
+    # Only import ExtractionManager here to avoid circular imports
+    from src.services.extraction import ExtractionManager
+    return ExtractionManager(openai_api_key=api_key)
+
 async def test_transcription(file_path: str):
     """
     Test transcribing an audio file using the SpeechManager.
@@ -37,7 +51,7 @@ async def test_transcription(file_path: str):
         return None
     
     try:
-        speech_manager = SpeechManager(openai_api_key=api_key)
+        speech_manager = _speech_manager(api_key)
         
         logger.info("SpeechManager initialized. Starting transcription...")
         
@@ -73,9 +87,6 @@ async def test_transcribe_with_extraction(file_path: str):
     if not transcription_result:
         return
     
-    # Only import ExtractionManager here to avoid circular imports
-    from src.services.extraction import ExtractionManager
-    
     try:
         logger.info("Initializing ExtractionManager for data extraction...")
         
@@ -85,8 +96,8 @@ async def test_transcribe_with_extraction(file_path: str):
             logger.error("ERROR: OpenAI API key not found for extraction.")
             return
         
-        # Initialize the ExtractionManager
-        extraction_manager = ExtractionManager(openai_api_key=api_key)
+        # Reuse the ExtractionManager built for earlier files
+        extraction_manager = _extraction_manager(api_key)
         
         # Extract meeting data from the transcription
         transcribed_text = transcription_result.get("text", "")
@@ -112,6 +123,21 @@ async def test_transcribe_with_extraction(file_path: str):
         print(f"\nError: {e}")
         return None
 
+async def run_directory(audio_files: List[str], extract: bool = False):
+    """
+    Run the transcription test for each file, sequentially, on one event loop.
+    
+    Args:
+        audio_files: Paths to the audio files to transcribe
+        extract: Whether to also extract meeting data from each transcription
+    """
+    for file_path in audio_files:
+        print(f"\n--- Testing file: {file_path} ---")
+        if extract:
+            await test_transcribe_with_extraction(file_path)
+        else:
+            await test_transcription(file_path)
+
 def main():
     """Main function to parse arguments and run tests."""
     parser = argparse.ArgumentParser(description="Test the speech-to-text service")
@@ -150,13 +176,8 @@ def main():
         
         print(f"Found {len(audio_files)} audio files to test")
         
-        # Process each file
-        for file_path in audio_files:
-            print(f"\n--- Testing file: {file_path} ---")
-            asyncio.run(
-                test_transcribe_with_extraction(file_path) if args.extract 
-                else test_transcription(file_path)
-            )
+        # Process all files on a single event loop
+        asyncio.run(run_directory(audio_files, args.extract))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file